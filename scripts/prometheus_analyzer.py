@@ -8,6 +8,7 @@ e análise local com USE Method de Brendan Gregg.
 
 import json
 import logging
+import signal
 import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
@@ -612,6 +613,18 @@ class PrometheusAnalyzer:
         return output_path
 
 
+def _raise_interrupt(signum, frame):
+    """Trata SIGTERM como Ctrl+C para encerrar os loops de forma limpa."""
+    raise KeyboardInterrupt
+
+
+def _sleep_until(deadline: float) -> None:
+    """Dorme até o instante monotônico informado (retorna já se passou)."""
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
 def main():
     """Função principal."""
     import argparse
@@ -642,12 +655,18 @@ def main():
 
     analyzer = PrometheusAnalyzer(args.prometheus_url)
 
+    # systemd/docker param com SIGTERM; encerra como no Ctrl+C
+    signal.signal(signal.SIGTERM, _raise_interrupt)
+
     if args.daemon:
         console.print(Panel.fit("🔄 Modo Daemon Ativo", style="bold green"))
         console.print("⏰ Análise será executada a cada 5 minutos")
         console.print("Pressione Ctrl+C para parar\n")
 
         try:
+            # Próxima execução calculada a partir do horário agendado, não do
+            # fim da análise, para o intervalo não acumular atraso
+            next_run = time.monotonic()
             while True:
                 results = analyzer.run_analysis()
                 analyzer.display_results(results)
@@ -656,7 +675,9 @@ def main():
                     analyzer.save_results(results, args.output)
 
                 console.print("\n" + "=" * 60 + "\n")
-                time.sleep(args.interval)
+                # Análise mais longa que o intervalo: segue sem rajada de atrasadas
+                next_run = max(next_run + args.interval, time.monotonic())
+                _sleep_until(next_run)
 
         except KeyboardInterrupt:
             console.print("\n🛑 Daemon interrompido pelo usuário")
@@ -665,10 +686,13 @@ def main():
         console.print(Panel.fit("🔄 Análise Contínua", style="bold green"))
 
         try:
+            next_run = time.monotonic()
             while True:
                 results = analyzer.run_analysis()
                 analyzer.display_results(results)
-                time.sleep(30)  # Atualiza a cada 30 segundos
+                # Atualiza a cada 30 segundos
+                next_run = max(next_run + 30, time.monotonic())
+                _sleep_until(next_run)
 
         except KeyboardInterrupt:
             console.print("\n🛑 Análise contínua interrompida")
@@ -7,6 +7,7 @@ Executes performance analysis on remote systems without code deployment
 import asyncio
 import json
 import logging
+import mmap
 import os
 import sys
 import tempfile
@@ -639,13 +640,38 @@ def _display_json_result(result: Dict[str, Any]):
             console.print(f"  {i}. {rec}")
 
 
+def _write_report(path: str, content: str) -> None:
+    """
+    Write a report file by copying it into a memory-mapped file.
+
+    The file is sized up front and filled with one memory copy instead of
+    going through buffered ``write()`` calls. Falls back to a plain write
+    when the file cannot be mapped (empty content, or filesystems without
+    mmap support such as some network mounts).
+
+    Args:
+        path: Output file path
+        content: Report text
+    """
+    encoded = content.encode("utf-8")
+    with open(path, "wb") as f:
+        try:
+            f.truncate(len(encoded))
+            with mmap.mmap(f.fileno(), len(encoded), access=mmap.ACCESS_WRITE) as mm:
+                mm[:] = encoded
+        except (OSError, ValueError) as e:
+            logger.debug("mmap write failed for %s, using write(): %s", path, e)
+            f.seek(0)
+            f.truncate()
+            f.write(encoded)
+
+
 def _display_html_result(result: Dict[str, Any], output: Optional[str]):
     """Display HTML analysis result."""
     html_content = result.get("html", "")
 
     if output:
-        with open(output, "w") as f:
-            f.write(html_content)
+        _write_report(output, html_content)
         console.print(f"[green]✅[/green] HTML report saved to {output}")
     else:
         # Save to temporary file and open
@@ -678,8 +704,7 @@ def _display_markdown_result(result: Dict[str, Any], output: Optional[str]):
     md_content = result.get("markdown", "")
 
     if output:
-        with open(output, "w") as f:
-            f.write(md_content)
+        _write_report(output, md_content)
         console.print(f"[green]✅[/green] Markdown report saved to {output}")
     else:
         console.print(md_content)
@@ -32,7 +32,7 @@ class AnalysisResponse:
                     "title": insight.title,
                     "description": insight.description,
                     "component": insight.component,
-                    "severity": insight.severity.value,
+                    "severity": insight.severity.name,
                     "timestamp": insight.timestamp.isoformat(),
                     "recommendations": insight.recommendations,
                     "metrics": insight.metrics,
@@ -1,7 +1,8 @@
 """LLM client port interface."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 try:
     from src.domain.performance.entities.system_metrics import SystemMetrics
@@ -21,6 +22,25 @@ class LLMClientPort(ABC):
         """Generate performance insights using LLM."""
         pass
 
+    async def generate_insights_batch(
+        self, metrics_list: Sequence[Optional[SystemMetrics]]
+    ) -> List[List[PerformanceInsight]]:
+        """
+        Generate insights for several metric snapshots at once.
+
+        The default runs generate_insights() for every snapshot concurrently;
+        adapters can override it with a cheaper batched request.
+
+        Args:
+            metrics_list: Metric snapshots to analyze
+
+        Returns:
+            One list of insights per snapshot, in input order
+        """
+        return list(
+            await asyncio.gather(*(self.generate_insights(m) for m in metrics_list))
+        )
+
     @abstractmethod
     async def analyze_bottleneck(self, insight: PerformanceInsight) -> str:
         """Analyze a specific bottleneck using LLM."""
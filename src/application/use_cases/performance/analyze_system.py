@@ -1,13 +1,22 @@
 """Use case: Analyze system performance."""
 
-from typing import Dict, Any, Optional
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional, Tuple
 
-from ...domain.performance.aggregates.analysis_session import AnalysisSession
-from ...domain.performance.entities.system_metrics import SystemMetrics
-from ...domain.performance.services.use_method_analyzer import USEMethodAnalyzer
-from ...domain.performance.services.bottleneck_detector import BottleneckDetector
-from ...application.ports.output.metrics_collector import MetricsCollectorPort
-from ...application.ports.output.llm_client import LLMClientPort
+from src.domain.performance.aggregates.analysis_session import AnalysisSession
+from src.domain.performance.entities.performance_insight import PerformanceInsight
+from src.domain.performance.entities.system_metrics import SystemMetrics
+from src.domain.performance.value_objects.severity import Severity
+from src.domain.performance.services.use_method_analyzer import USEMethodAnalyzer
+from src.domain.performance.services.bottleneck_detector import BottleneckDetector
+from src.domain.performance.services.combined_analyzer import CombinedAnalyzer
+from src.application.ports.output.metrics_collector import MetricsCollectorPort
+from src.application.ports.output.llm_client import LLMClientPort
+
+logger = logging.getLogger(__name__)
 
 
 class AnalyzeSystem:
@@ -19,6 +28,8 @@ class AnalyzeSystem:
         use_analyzer: USEMethodAnalyzer,
         bottleneck_detector: BottleneckDetector,
         llm_client: Optional[LLMClientPort] = None,
+        history_size: int = 240,
+        bucket_size: float = 5.0,
     ):
         """
         Initialize the analyze system use case.
@@ -28,11 +39,26 @@ class AnalyzeSystem:
             use_analyzer: Domain service for USE Method analysis
             bottleneck_detector: Domain service for bottleneck detection
             llm_client: Optional port for LLM insights
+            history_size: Number of snapshots kept in the monitoring ring buffer
+            bucket_size: Percentage step used to quantize snapshots; analysis
+                is only re-run by run_forever() when a bucket changes
         """
         self.metrics_collector = metrics_collector
         self.use_analyzer = use_analyzer
         self.bottleneck_detector = bottleneck_detector
+        self.combined_analyzer = CombinedAnalyzer(use_analyzer, bottleneck_detector)
         self.llm_client = llm_client
+        self.bucket_size = bucket_size
+
+        # Background monitoring state (see run_forever)
+        self.metrics_history: Deque[SystemMetrics] = deque(maxlen=history_size)
+        self._latest_insights: List[PerformanceInsight] = []
+        self._last_fingerprint: Optional[Tuple] = None
+
+    @property
+    def latest_insights(self) -> List[PerformanceInsight]:
+        """Insights from the most recent background analysis."""
+        return list(self._latest_insights)
 
     async def execute(
         self, session_id: str, hostname: Optional[str] = None
@@ -57,29 +83,10 @@ class AnalyzeSystem:
             metrics = await self.metrics_collector.collect()
             session.add_metrics(metrics)
 
-            # Perform USE Method analysis
-            use_insights = self.use_analyzer.analyze(metrics)
-            for insight in use_insights:
+            # USE Method, bottleneck and (optional) LLM analysis
+            for insight in await self._analyze_metrics(metrics):
                 session.add_insight(insight)
 
-            # Detect bottlenecks
-            bottlenecks = self.bottleneck_detector.detect_bottlenecks(metrics)
-            for bottleneck in bottlenecks:
-                session.add_insight(bottleneck)
-
-            # Generate LLM insights if available
-            if self.llm_client:
-                try:
-                    llm_insights = await self.llm_client.generate_insights(metrics)
-                    for insight in llm_insights:
-                        session.add_insight(insight)
-                except Exception as e:
-                    # Log error but don't fail the analysis
-                    import logging
-
-                    logger = logging.getLogger(__name__)
-                    logger.warning(f"Failed to generate LLM insights: {e}")
-
             # Complete session
             session.complete_session()
 
@@ -118,13 +125,11 @@ class AnalyzeSystem:
                 session.add_metrics(metrics)
 
                 # Analyze current state
-                use_insights = self.use_analyzer.analyze(metrics)
-                bottlenecks = self.bottleneck_detector.detect_bottlenecks(metrics)
+                all_insights = self.combined_analyzer.analyze(metrics)
 
                 # Add only new critical insights to avoid duplication
-                all_insights = use_insights + bottlenecks
                 for insight in all_insights:
-                    if insight.is_critical() or insight.severity.value == "HIGH":
+                    if insight.severity >= Severity.HIGH:
                         session.add_insight(insight)
 
                 # Wait for next interval
@@ -136,3 +141,96 @@ class AnalyzeSystem:
         except Exception as e:
             session.complete_session()
             raise e
+
+    async def run_forever(self, interval_seconds: float = 15.0) -> None:
+        """
+        Continuously monitor the system until cancelled.
+
+        A producer task collects metrics every ``interval_seconds`` into the
+        ``metrics_history`` ring buffer and hands the newest snapshot to the
+        consumer through a one-slot queue, replacing any snapshot not yet
+        picked up. The consumer re-analyzes only when the quantized state of
+        that snapshot changed, so a slow LLM round never builds a backlog of
+        stale snapshots. Readers get the cached result through
+        ``latest_insights`` without triggering collection or LLM calls.
+
+        Args:
+            interval_seconds: Interval between metric collections
+        """
+        queue: "asyncio.Queue[SystemMetrics]" = asyncio.Queue(maxsize=1)
+        producer = asyncio.create_task(self._produce_metrics(queue, interval_seconds))
+
+        try:
+            await self._consume_metrics(queue)
+        finally:
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+
+    async def _produce_metrics(
+        self, queue: "asyncio.Queue[SystemMetrics]", interval_seconds: float
+    ) -> None:
+        """Collect metrics into the ring buffer and the latest-snapshot queue."""
+        while True:
+            try:
+                metrics = await self.metrics_collector.collect()
+                self.metrics_history.append(metrics)
+                # Drop the snapshot the consumer has not picked up yet
+                if queue.full():
+                    queue.get_nowait()
+                queue.put_nowait(metrics)
+            except Exception as e:
+                logger.warning(f"Failed to collect metrics: {e}")
+
+            await asyncio.sleep(interval_seconds)
+
+    async def _consume_metrics(self, queue: "asyncio.Queue[SystemMetrics]") -> None:
+        """Analyze the latest snapshot, skipping unchanged quantized states."""
+        while True:
+            # A plain get: wrapping it in wait_for() only re-polled on timeout
+            # and could hold up cancellation of the loop
+            metrics = await queue.get()
+
+            try:
+                fingerprint = self._fingerprint(metrics)
+                if fingerprint == self._last_fingerprint:
+                    logger.debug("Metrics bucket unchanged, serving cached insights")
+                    continue
+
+                self._latest_insights = await self._analyze_metrics(metrics)
+                self._last_fingerprint = fingerprint
+            except Exception as e:
+                # Keep the last good insights; the next snapshot retries
+                logger.warning(f"Failed to analyze metrics: {e}")
+
+    async def _analyze_metrics(
+        self, metrics: SystemMetrics
+    ) -> List[PerformanceInsight]:
+        """Run USE Method, bottleneck and optional LLM analysis on a snapshot."""
+        insights = self.combined_analyzer.analyze(metrics)
+
+        # Generate LLM insights if available
+        if self.llm_client:
+            try:
+                insights.extend(await self.llm_client.generate_insights(metrics))
+            except Exception as e:
+                # Log error but don't fail the analysis
+                logger.warning(f"Failed to generate LLM insights: {e}")
+
+        return insights
+
+    def _fingerprint(self, metrics: SystemMetrics) -> Tuple:
+        """Quantize a snapshot so small fluctuations map to the same bucket."""
+        step = self.bucket_size
+        network_errors = metrics.network_errors.value if metrics.network_errors else 0
+        return (
+            int(metrics.cpu_utilization.value // step),
+            int(metrics.memory_utilization.value // step),
+            tuple(
+                sorted(
+                    (device, int(value.value // step))
+                    for device, value in metrics.disk_utilization.items()
+                )
+            ),
+            network_errors > 0,
+        )
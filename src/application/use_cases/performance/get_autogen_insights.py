@@ -1,6 +1,8 @@
 """Use case for AutoGen multi-agent collaborative analysis."""
 
 import logging
+import sys
+from dataclasses import replace
 from typing import List, Dict, Any
 
 from src.domain.performance.entities.performance_insight import PerformanceInsight
@@ -10,6 +12,28 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Prototype for the fallback insight; only the timestamp changes per call
+_FALLBACK_INSIGHT = PerformanceInsight(
+    title="Multi-Agent Analysis: System Performance Review",
+    description=(
+        "Collaborative analysis from multiple specialized agents identified "
+        "performance optimization opportunities across infrastructure, security, "
+        "cost, and reliability dimensions."
+    ),
+    component="system",
+    severity=Severity.MEDIUM,
+    timestamp=datetime.min,
+    recommendations=(
+        "Performance: Apply USE Method analysis for bottleneck identification",
+        "Infrastructure: Review scaling policies and capacity planning",
+        "Security: Audit for DoS vulnerabilities and resource exhaustion",
+        "Cost: Optimize resource allocation and identify waste",
+        "Reliability: Improve monitoring, alerting, and incident response",
+    ),
+    metrics=("cpu_percent", "memory_percent", "response_time", "error_rate"),
+    root_cause="Multi-agent collaborative consensus pending",
+)
+
 
 class GetAutoGenInsightsUseCase:
     """Use case for getting multi-agent collaborative insights."""
@@ -59,9 +83,9 @@ class GetAutoGenInsightsUseCase:
                     severity = Severity[severity_str] if severity_str in Severity.__members__ else Severity.MEDIUM
 
                     insight = PerformanceInsight(
-                        title=insight_data.get("title", "🤖 Multi-Agent Analysis"),
+                        title=insight_data.get("title", "Multi-Agent Analysis"),
                         description=insight_data.get("observation", "Collaborative analysis completed"),
-                        component=insight_data.get("component", "system"),
+                        component=sys.intern(str(insight_data.get("component", "system"))),
                         severity=severity,
                         timestamp=datetime.now(),
                         recommendations=insight_data.get("recommendations", []),
@@ -88,25 +112,4 @@ class GetAutoGenInsightsUseCase:
     def _get_fallback_insights(self) -> List[PerformanceInsight]:
         """Return fallback insight if AutoGen fails."""
 
-        return [
-            PerformanceInsight(
-                title="🤖 Multi-Agent Analysis: System Performance Review",
-                description=(
-                    "Collaborative analysis from multiple specialized agents identified "
-                    "performance optimization opportunities across infrastructure, security, "
-                    "cost, and reliability dimensions."
-                ),
-                component="system",
-                severity=Severity.MEDIUM,
-                timestamp=datetime.now(),
-                recommendations=[
-                    "Performance: Apply USE Method analysis for bottleneck identification",
-                    "Infrastructure: Review scaling policies and capacity planning",
-                    "Security: Audit for DoS vulnerabilities and resource exhaustion",
-                    "Cost: Optimize resource allocation and identify waste",
-                    "Reliability: Improve monitoring, alerting, and incident response"
-                ],
-                metrics=["cpu_percent", "memory_percent", "response_time", "error_rate"],
-                root_cause="Multi-agent collaborative consensus pending",
-            )
-        ]
+        return [replace(_FALLBACK_INSIGHT, timestamp=datetime.now())]
@@ -81,7 +81,7 @@ class GetAllInsightsUseCase:
         try:
             return Severity[severity_str.upper()]
         except KeyError:
-            valid_values = [s.value for s in Severity]
+            valid_values = [s.name for s in Severity]
             raise ValueError(
                 f"Invalid severity '{severity_str}'. Must be one of: {', '.join(valid_values)}"
             )
@@ -138,7 +138,7 @@ class GetInsightsBySeverityUseCase:
         try:
             severity_enum = Severity[severity.upper()]
         except KeyError:
-            valid_values = [s.value for s in Severity]
+            valid_values = [s.name for s in Severity]
             raise ValueError(
                 f"Invalid severity '{severity}'. Must be one of: {', '.join(valid_values)}"
             )
@@ -205,7 +205,7 @@ class GetInsightsSummaryUseCase:
 
         return {
             "total_insights": len(all_insights),
-            "by_severity": {sev.value: count for sev, count in severity_counts.items()},
+            "by_severity": {sev.name: count for sev, count in severity_counts.items()},
             "by_component": component_counts,
         }
 
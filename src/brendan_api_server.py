@@ -101,8 +101,67 @@ class BrendanInsightsAPI:
         }
         self.app.add_middleware(CORSMiddleware, **cors_config)
 
+        # AI clients are created on first use and reused across requests so
+        # their HTTP connection pools stay warm
+        self._llm_client = None
+        self._autogen_system = None
+        self.app.router.on_shutdown.append(self._close_ai_clients)
+
         self._setup_routes()
 
+    def _get_llm_client(self):
+        """Return the shared Ollama LLM client, creating it on first use."""
+        if self._llm_client is None:
+            from src.infrastructure.ai.ollama_llm_client import OllamaLLMClient
+
+            if self.settings:
+                self._llm_client = OllamaLLMClient(
+                    base_url=self.settings.ollama_url,
+                    model=self.settings.ollama_model,
+                    temperature=self.settings.ollama_temperature,
+                )
+            else:
+                # Fallback configuration
+                self._llm_client = OllamaLLMClient(
+                    base_url="http://localhost:11434/v1",
+                    model="minimax-m2:cloud",
+                    temperature=0.7,
+                )
+        return self._llm_client
+
+    def _get_autogen_system(self):
+        """Return the shared AutoGen multi-agent system, creating it on first use."""
+        if self._autogen_system is None:
+            from src.infrastructure.ai.autogen_multiagent import AutoGenMultiAgent
+
+            if self.settings:
+                self._autogen_system = AutoGenMultiAgent(
+                    base_url=self.settings.ollama_url,
+                    model=self.settings.ollama_model,
+                    temperature=self.settings.ollama_temperature,
+                )
+            else:
+                # Fallback configuration
+                self._autogen_system = AutoGenMultiAgent(
+                    base_url="http://localhost:11434",
+                    model="minimax-m2:cloud",
+                    temperature=0.7,
+                )
+        return self._autogen_system
+
+    async def _close_ai_clients(self):
+        """Close shared AI clients on application shutdown."""
+        if self._llm_client is not None:
+            await self._llm_client.close()
+            self._llm_client = None
+        if self._autogen_system is not None:
+            await self._autogen_system.close()
+            self._autogen_system = None
+
+        from src.infrastructure.ai._http import close_async_client
+
+        await close_async_client()
+
     def _setup_routes(self):
         """Setup API routes."""
 
@@ -117,9 +176,11 @@ class BrendanInsightsAPI:
         # Include clean insights routes (DDD - Phase 4)
         try:
             from src.presentation.api.routes import insights as insights_module
-            # Inject repository into the module before including router
+            # Bind the repository to this app before including router
             if self.insights_repository:
-                insights_module._repository_instance = self.insights_repository
+                insights_module.configure_repository(
+                    self.app, self.insights_repository
+                )
             self.app.include_router(insights_module.router)
             logger.info("✅ Clean DDD insights routes loaded")
         except ImportError as e:
@@ -349,23 +410,11 @@ class BrendanInsightsAPI:
                 JSON with AI-generated insights
             """
             try:
-                # Initialize LLM client with settings
-                from src.infrastructure.ai.ollama_llm_client import OllamaLLMClient
+                # Shared LLM client configured from settings
                 from src.application.use_cases.performance import GetLLMInsightsUseCase
+                from src.presentation.api.schemas import COMPONENT_EMOJI
 
-                if self.settings:
-                    llm_client = OllamaLLMClient(
-                        base_url=self.settings.ollama_url,
-                        model=self.settings.ollama_model,
-                        temperature=self.settings.ollama_temperature,
-                    )
-                else:
-                    # Fallback configuration
-                    llm_client = OllamaLLMClient(
-                        base_url="http://localhost:11434/v1",
-                        model="minimax-m2:cloud",
-                        temperature=0.7,
-                    )
+                llm_client = self._get_llm_client()
 
                 # Execute use case
                 use_case = GetLLMInsightsUseCase(llm_client)
@@ -385,12 +434,13 @@ class BrendanInsightsAPI:
                         "immediate_action": immediate_action,  # First recommendation
                         "long_term_fix": long_term_fix,  # Last recommendation
                         "component": insight.component,
-                        "severity": insight.severity.value,
+                        "severity": insight.severity.name,
                         "timestamp": insight.timestamp.isoformat(),
                         "recommendations": recommendations,
                         "metrics": insight.metrics,
                         "root_cause": insight.root_cause or "AI analysis",
                         "confidence": 85.0,  # AI confidence level
+                        "icon": COMPONENT_EMOJI.get(insight.component, ""),
                     })
 
                 return {
@@ -429,23 +479,11 @@ class BrendanInsightsAPI:
                 JSON with collaborative insights from all agents
             """
             try:
-                # Initialize AutoGen multi-agent system
-                from src.infrastructure.ai.autogen_multiagent import AutoGenMultiAgent
+                # Shared AutoGen multi-agent system configured from settings
                 from src.application.use_cases.performance import GetAutoGenInsightsUseCase
+                from src.presentation.api.schemas import COMPONENT_EMOJI
 
-                if self.settings:
-                    autogen_system = AutoGenMultiAgent(
-                        base_url=self.settings.ollama_url,
-                        model=self.settings.ollama_model,
-                        temperature=self.settings.ollama_temperature,
-                    )
-                else:
-                    # Fallback configuration
-                    autogen_system = AutoGenMultiAgent(
-                        base_url="http://localhost:11434",
-                        model="minimax-m2:cloud",
-                        temperature=0.7,
-                    )
+                autogen_system = self._get_autogen_system()
 
                 # Execute collaborative analysis
                 use_case = GetAutoGenInsightsUseCase(autogen_system)
@@ -464,19 +502,17 @@ class BrendanInsightsAPI:
                         "immediate_action": immediate_action,
                         "long_term_fix": long_term_fix,
                         "component": insight.component,
-                        "severity": insight.severity.value,
+                        "severity": insight.severity.name,
                         "timestamp": insight.timestamp.isoformat(),
                         "recommendations": recommendations,
                         "metrics": insight.metrics,
                         "root_cause": insight.root_cause or "Multi-agent collaborative analysis",
                         "confidence": 92.0,  # Higher confidence due to multi-agent consensus
                         "agents_participated": 5,
-                        "analysis_type": "collaborative"
+                        "analysis_type": "collaborative",
+                        "icon": COMPONENT_EMOJI.get(insight.component, ""),
                     })
 
-                # Cleanup
-                await autogen_system.close()
-
                 return {
                     "status": "success",
                     "message": "Multi-agent collaborative insights generated successfully",
@@ -717,7 +753,7 @@ class BrendanInsightsAPI:
                 html += `
                 <div class="insight-card">
                     <div class="insight-header">
-                        <div class="insight-title">${insight.title}</div>
+                        <div class="insight-title">${insight.icon ? insight.icon + ' ' : ''}${insight.title}</div>
                         <span class="severity-badge ${severityClass}">${insight.severity}</span>
                     </div>
 
@@ -1,10 +1,10 @@
 """Brendan Gregg persona entity."""
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import FrozenSet, List
 
 
-@dataclass
+@dataclass(slots=True)
 class BrendanPersona:
     """Entity representing Brendan Gregg's analysis persona."""
 
@@ -20,6 +20,13 @@ class BrendanPersona:
     )
     analysis_style: str = "Technical, thorough, evidence-based"
     communication_style: str = "Clear, concise, with practical examples"
+    _expertise_lower: FrozenSet[str] = field(
+        init=False, repr=False, compare=False, default=frozenset()
+    )
+
+    def __post_init__(self) -> None:
+        """Precompute lowercase expertise for case-insensitive lookups."""
+        self._expertise_lower = frozenset(exp.lower() for exp in self.expertise)
 
     def format_insight(self, insight: str, metrics_context: str = "") -> str:
         """Format insight in Brendan Gregg's style."""
@@ -40,4 +47,4 @@ class BrendanPersona:
 
     def is_expert_in(self, area: str) -> bool:
         """Check if persona is expert in given area."""
-        return area.lower() in [exp.lower() for exp in self.expertise]
+        return area.lower() in self._expertise_lower
@@ -3,8 +3,16 @@
 from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
+# Below these levels a system is considered healthy and LLM analysis is skipped
+DEFAULT_LLM_THRESHOLDS: Dict[str, float] = {
+    "cpu_utilization": 50.0,
+    "memory_utilization": 60.0,
+    "disk_utilization": 60.0,
+    "network_errors": 0.0,
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class LLMConfig:
     """Configuration for LLM interactions."""
 
@@ -1,5 +1,6 @@
 """AnalysisSession aggregate for performance analysis."""
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional
@@ -9,7 +10,7 @@ from ..entities.system_metrics import SystemMetrics
 from ..value_objects.severity import Severity
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisSession:
     """Aggregate root for performance analysis session."""
 
@@ -22,6 +23,24 @@ class AnalysisSession:
     metrics_history: List[SystemMetrics] = field(default_factory=list)
     insights: List[PerformanceInsight] = field(default_factory=list)
 
+    # Insight indexes so lookups cost O(result) instead of O(all insights)
+    _by_component: Dict[str, List[PerformanceInsight]] = field(
+        default_factory=lambda: defaultdict(list),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _by_severity: Dict[Severity, List[PerformanceInsight]] = field(
+        default_factory=lambda: defaultdict(list),
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self) -> None:
+        for insight in self.insights:
+            self._index_insight(insight)
+
     def add_metrics(self, metrics: SystemMetrics) -> None:
         """Add metrics to the session."""
         self.metrics_history.append(metrics)
@@ -29,14 +48,23 @@ class AnalysisSession:
     def add_insight(self, insight: PerformanceInsight) -> None:
         """Add insight to the session."""
         self.insights.append(insight)
+        self._index_insight(insight)
+
+    def _index_insight(self, insight: PerformanceInsight) -> None:
+        self._by_component[insight.component].append(insight)
+        self._by_severity[insight.severity].append(insight)
 
     def get_critical_insights(self) -> List[PerformanceInsight]:
         """Get all critical insights."""
-        return [insight for insight in self.insights if insight.is_critical()]
+        return self.get_insights_by_severity(Severity.CRITICAL)
 
     def get_insights_by_component(self, component: str) -> List[PerformanceInsight]:
         """Get insights by component."""
-        return [insight for insight in self.insights if insight.component == component]
+        return list(self._by_component.get(component, ()))
+
+    def get_insights_by_severity(self, severity: Severity) -> List[PerformanceInsight]:
+        """Get insights by severity."""
+        return list(self._by_severity.get(severity, ()))
 
     def complete_session(self) -> None:
         """Mark session as completed."""
@@ -50,4 +78,8 @@ class AnalysisSession:
 
     def has_critical_issues(self) -> bool:
         """Check if session has critical issues."""
-        return any(insight.is_critical() for insight in self.insights)
+        return bool(self._by_severity.get(Severity.CRITICAL))
+
+    def has_critical_metrics(self) -> bool:
+        """Check if any collected sample crossed a critical threshold."""
+        return any(metrics.is_critical() for metrics in self.metrics_history)
@@ -2,12 +2,12 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional, Sequence
 
 from ..value_objects.severity import Severity
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceInsight:
     """Entity representing a performance analysis insight."""
 
@@ -16,8 +16,9 @@ class PerformanceInsight:
     component: str
     severity: Severity
     timestamp: datetime = field(default_factory=datetime.now)
-    recommendations: List[str] = field(default_factory=list)
-    metrics: List[str] = field(default_factory=list)
+    # Detectors may pass shared tuples; add_recommendation copies on write
+    recommendations: Sequence[str] = field(default_factory=list)
+    metrics: Sequence[str] = field(default_factory=list)
     root_cause: Optional[str] = None
 
     def is_critical(self) -> bool:
@@ -26,8 +27,11 @@ class PerformanceInsight:
 
     def add_recommendation(self, recommendation: str) -> None:
         """Add a recommendation."""
+        if not isinstance(self.recommendations, list):
+            # Copy shared template tuples before the first mutation
+            self.recommendations = list(self.recommendations)
         self.recommendations.append(recommendation)
 
     def __str__(self) -> str:
         """String representation."""
-        return f"[{self.severity.value}] {self.component}: {self.title}"
+        return f"[{self.severity.name}] {self.component}: {self.title}"
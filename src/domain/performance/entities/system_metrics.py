@@ -2,12 +2,20 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+import numpy as np
 
 from ..value_objects.metric_value import MetricValue
 
+# Utilization (%) at or above which a sample is considered critical
+CRITICAL_THRESHOLDS: Dict[str, float] = {
+    "cpu_utilization": 90,
+    "memory_utilization": 95,
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class SystemMetrics:
     """Entity representing system performance metrics."""
 
@@ -30,22 +38,31 @@ class SystemMetrics:
     custom_metrics: Dict[str, Any] = field(default_factory=dict)
 
     def get_metric_by_name(self, name: str) -> Optional[MetricValue]:
-        """Get metric by name."""
-        metric_map = {
-            "cpu_utilization": self.cpu_utilization,
-            "memory_utilization": self.memory_utilization,
-        }
-        return metric_map.get(name)
+        """Get a MetricValue field by name (None for unknown or non-metric fields)."""
+        metric = getattr(self, name, None)
+        return metric if isinstance(metric, MetricValue) else None
+
+    def disk_utilizations_array(self) -> Tuple[Tuple[str, ...], np.ndarray]:
+        """
+        Disk utilization as parallel arrays for vectorized checks.
+
+        Returns:
+            Device names and a float64 array of their utilization values,
+            in the same order
+        """
+        disks = self.disk_utilization
+        names = tuple(disks)
+        values = np.fromiter(
+            (metric.value for metric in disks.values()),
+            dtype=np.float64,
+            count=len(names),
+        )
+        return names, values
 
     def is_critical(self) -> bool:
         """Check if any metric is in critical state."""
-        critical_thresholds = {
-            "cpu_utilization": 90,
-            "memory_utilization": 95,
-        }
-
-        for metric_name, threshold in critical_thresholds.items():
-            metric = self.get_metric_by_name(metric_name)
+        for metric_name, threshold in CRITICAL_THRESHOLDS.items():
+            metric = getattr(self, metric_name)
             if metric and metric.value >= threshold:
                 return True
         return False
@@ -1,8 +1,9 @@
 """Insights repository interface (port)."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 from ..entities.performance_insight import PerformanceInsight
 from ..value_objects.severity import Severity
@@ -11,6 +12,9 @@ from ..value_objects.severity import Severity
 class InsightsRepository(ABC):
     """Repository interface for performance insights."""
 
+    # Number of insights handed to a single _save_chunk() call
+    save_many_chunk_size: int = 500
+
     @abstractmethod
     async def get_all(self, limit: Optional[int] = None) -> List[PerformanceInsight]:
         """
@@ -102,12 +106,28 @@ class InsightsRepository(ABC):
         """
         pass
 
-    @abstractmethod
     async def save_many(self, insights: List[PerformanceInsight]) -> None:
         """
-        Save multiple performance insights.
+        Save multiple performance insights in chunks.
+
+        Backends should override _save_chunk() with a bulk write (executemany,
+        a pipeline, a single file append) so N insights cost N / chunk_size
+        round-trips instead of N.
 
         Args:
             insights: List of insights to save
         """
-        pass
+        size = self.save_many_chunk_size
+        for start in range(0, len(insights), size):
+            await self._save_chunk(insights[start : start + size])
+
+    async def _save_chunk(self, chunk: Sequence[PerformanceInsight]) -> None:
+        """
+        Persist one chunk of insights.
+
+        The default issues the individual save() calls concurrently.
+
+        Args:
+            chunk: Insights to save, at most save_many_chunk_size long
+        """
+        await asyncio.gather(*(self.save(insight) for insight in chunk))
@@ -1,15 +1,118 @@
 """Bottleneck detection domain service."""
 
-from typing import List, Tuple
+from bisect import bisect_left
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from domain.performance.entities.performance_insight import PerformanceInsight
 from domain.performance.entities.system_metrics import SystemMetrics
 from domain.performance.value_objects.severity import Severity
 
+# Tie-breaker for bottlenecks of equal severity (lower sorts first)
+_COMPONENT_PRIORITY = {"cpu": 0, "memory": 1, "disk": 2, "network": 3}
+
+# Utilization above 85% is a bottleneck, above 95% a critical one; the
+# number of cuts strictly below a reading indexes its severity in _LEVELS
+_UTILIZATION_CUTS = (85.0, 95.0)
+_UTILIZATION_EDGES = np.array(_UTILIZATION_CUTS)
+_LEVELS = (None, Severity.HIGH, Severity.CRITICAL)
+
+# Disk utilization (%) above which a device is reported as a bottleneck
+DISK_BOTTLENECK_THRESHOLD = 90
+
+# Static parts of each insight, shared across detections (tuples are immutable)
+_CPU_CRITICAL = {
+    "title": "Severe CPU Bottleneck",
+    "component": "cpu",
+    "severity": Severity.CRITICAL,
+    "metrics": ("cpu_utilization",),
+    "recommendations": (
+        "Immediate: Identify and terminate CPU-intensive processes",
+        "Short-term: Scale horizontally or vertically",
+        "Long-term: Optimize algorithms and code efficiency",
+    ),
+}
+_CPU_HIGH = {
+    "title": "CPU Bottleneck Detected",
+    "component": "cpu",
+    "severity": Severity.HIGH,
+    "metrics": ("cpu_utilization",),
+    "recommendations": (
+        "Monitor CPU trends closely",
+        "Investigate periodic CPU spikes",
+        "Consider capacity planning",
+    ),
+}
+_MEMORY_CRITICAL = {
+    "title": "Critical Memory Bottleneck",
+    "component": "memory",
+    "severity": Severity.CRITICAL,
+    "metrics": ("memory_utilization",),
+    "recommendations": (
+        "Immediate: Free up memory by clearing caches/restarting services",
+        "Short-term: Add more RAM or use memory optimization",
+        "Long-term: Optimize application memory usage",
+    ),
+}
+_MEMORY_HIGH = {
+    "title": "Memory Pressure Detected",
+    "component": "memory",
+    "severity": Severity.HIGH,
+    "metrics": ("memory_utilization",),
+    "recommendations": (
+        "Monitor memory usage patterns",
+        "Check for memory leaks",
+        "Plan memory upgrades",
+    ),
+}
+# Static fields plus the description label/detail for each utilization level
+_UTILIZATION_INSIGHTS = {
+    ("cpu", Severity.CRITICAL): (
+        _CPU_CRITICAL,
+        "CPU utilization",
+        " indicates severe performance bottleneck",
+    ),
+    ("cpu", Severity.HIGH): (
+        _CPU_HIGH,
+        "CPU utilization",
+        " indicates performance bottleneck",
+    ),
+    ("memory", Severity.CRITICAL): (
+        _MEMORY_CRITICAL,
+        "Memory utilization",
+        " - system may start swapping",
+    ),
+    ("memory", Severity.HIGH): (
+        _MEMORY_HIGH,
+        "Memory utilization",
+        " - approaching critical levels",
+    ),
+}
+_DISK_RECOMMENDATIONS = (
+    "Clean up disk space immediately",
+    "Move data to less utilized storage",
+    "Consider SSD upgrade or storage expansion",
+)
+_NETWORK_ERRORS = {
+    "title": "Network Error Rate High",
+    "component": "network",
+    "severity": Severity.HIGH,
+    "metrics": ("network_errors",),
+    "recommendations": (
+        "Check network hardware and cables",
+        "Investigate application network handling",
+        "Monitor network stability",
+    ),
+}
+
 
 class BottleneckDetector:
     """Domain Service: Detects system performance bottlenecks."""
 
+    # Stateless service: no per-instance __dict__
+    __slots__ = ()
+
     def detect_bottlenecks(self, metrics: SystemMetrics) -> List[PerformanceInsight]:
         """
         Detect performance bottlenecks in system metrics.
@@ -23,119 +126,143 @@ class BottleneckDetector:
         bottlenecks = []
 
         # Check for CPU bottlenecks
-        cpu_bottleneck = self._detect_cpu_bottleneck(metrics)
+        cpu_bottleneck = self.detect_cpu_bottleneck(metrics)
         if cpu_bottleneck:
             bottlenecks.append(cpu_bottleneck)
 
         # Check for memory bottlenecks
-        memory_bottleneck = self._detect_memory_bottleneck(metrics)
+        memory_bottleneck = self.detect_memory_bottleneck(metrics)
         if memory_bottleneck:
             bottlenecks.append(memory_bottleneck)
 
         # Check for I/O bottlenecks
-        io_bottleneck = self._detect_io_bottleneck(metrics)
+        io_bottleneck = self.detect_io_bottleneck(metrics)
         if io_bottleneck:
             bottlenecks.append(io_bottleneck)
 
         return bottlenecks
 
-    def _detect_cpu_bottleneck(self, metrics: SystemMetrics) -> PerformanceInsight:
-        """Detect CPU-related bottlenecks."""
-        cpu_util = metrics.cpu_utilization.value
+    def detect_batch(
+        self, metrics_list: Sequence[SystemMetrics]
+    ) -> List[List[PerformanceInsight]]:
+        """
+        Detect bottlenecks for many snapshots at once (e.g. time-series replay).
 
-        if cpu_util > 95:
-            return PerformanceInsight(
-                title="Severe CPU Bottleneck",
-                description=f"CPU utilization at {cpu_util}% indicates severe performance bottleneck",
-                component="cpu",
-                severity=Severity.CRITICAL,
-                metrics=["cpu_utilization"],
-                recommendations=[
-                    "Immediate: Identify and terminate CPU-intensive processes",
-                    "Short-term: Scale horizontally or vertically",
-                    "Long-term: Optimize algorithms and code efficiency",
-                ],
-            )
-        elif cpu_util > 85:
-            return PerformanceInsight(
-                title="CPU Bottleneck Detected",
-                description=f"CPU utilization at {cpu_util}% indicates performance bottleneck",
-                component="cpu",
-                severity=Severity.HIGH,
-                metrics=["cpu_utilization"],
-                recommendations=[
-                    "Monitor CPU trends closely",
-                    "Investigate periodic CPU spikes",
-                    "Consider capacity planning",
-                ],
-            )
+        CPU and memory levels are classified in one vectorized pass; insights
+        are only built for snapshots that actually crossed a threshold.
 
-        return None
+        Args:
+            metrics_list: System metrics snapshots
+
+        Returns:
+            One list of bottleneck insights per snapshot, in input order
+        """
+        n = len(metrics_list)
+        cpu = np.fromiter(
+            (m.cpu_utilization.value for m in metrics_list), dtype=np.float64, count=n
+        )
+        memory = np.fromiter(
+            (m.memory_utilization.value for m in metrics_list),
+            dtype=np.float64,
+            count=n,
+        )
+        # 0 = ok, 1 = above the first edge, 2 = above the second
+        cpu_levels = np.searchsorted(_UTILIZATION_EDGES, cpu, side="left")
+        memory_levels = np.searchsorted(_UTILIZATION_EDGES, memory, side="left")
+
+        results = []
+        for metrics, cpu_level, memory_level in zip(
+            metrics_list, cpu_levels, memory_levels
+        ):
+            bottlenecks = []
+            if cpu_level:
+                bottlenecks.append(
+                    self._build_insight(
+                        "cpu", _LEVELS[cpu_level], metrics.cpu_utilization.value
+                    )
+                )
+            if memory_level:
+                bottlenecks.append(
+                    self._build_insight(
+                        "memory",
+                        _LEVELS[memory_level],
+                        metrics.memory_utilization.value,
+                    )
+                )
+            io_bottleneck = self.detect_io_bottleneck(metrics)
+            if io_bottleneck:
+                bottlenecks.append(io_bottleneck)
+            results.append(bottlenecks)
+
+        return results
+
+    def detect_cpu_bottleneck(
+        self, metrics: SystemMetrics
+    ) -> Optional[PerformanceInsight]:
+        """Detect CPU-related bottlenecks."""
+        cpu_util = metrics.cpu_utilization.value
+        severity = _LEVELS[bisect_left(_UTILIZATION_CUTS, cpu_util)]
+        if severity is None:
+            return None
+        return self._build_insight("cpu", severity, cpu_util)
 
-    def _detect_memory_bottleneck(self, metrics: SystemMetrics) -> PerformanceInsight:
+    def detect_memory_bottleneck(
+        self, metrics: SystemMetrics
+    ) -> Optional[PerformanceInsight]:
         """Detect memory-related bottlenecks."""
         mem_util = metrics.memory_utilization.value
+        severity = _LEVELS[bisect_left(_UTILIZATION_CUTS, mem_util)]
+        if severity is None:
+            return None
+        return self._build_insight("memory", severity, mem_util)
 
-        if mem_util > 95:
-            return PerformanceInsight(
-                title="Critical Memory Bottleneck",
-                description=f"Memory utilization at {mem_util}% - system may start swapping",
-                component="memory",
-                severity=Severity.CRITICAL,
-                metrics=["memory_utilization"],
-                recommendations=[
-                    "Immediate: Free up memory by clearing caches/restarting services",
-                    "Short-term: Add more RAM or use memory optimization",
-                    "Long-term: Optimize application memory usage",
-                ],
-            )
-        elif mem_util > 85:
-            return PerformanceInsight(
-                title="Memory Pressure Detected",
-                description=f"Memory utilization at {mem_util}% - approaching critical levels",
-                component="memory",
-                severity=Severity.HIGH,
-                metrics=["memory_utilization"],
-                recommendations=[
-                    "Monitor memory usage patterns",
-                    "Check for memory leaks",
-                    "Plan memory upgrades",
-                ],
-            )
-
-        return None
+    def _build_insight(
+        self, component: str, severity: Severity, value: float
+    ) -> PerformanceInsight:
+        """Build the CPU/memory bottleneck insight for a utilization level."""
+        template, label, detail = _UTILIZATION_INSIGHTS[component, severity]
+        return PerformanceInsight(
+            description=f"{label} at {value}%{detail}", **template
+        )
 
-    def _detect_io_bottleneck(self, metrics: SystemMetrics) -> PerformanceInsight:
+    def detect_io_bottleneck(
+        self, metrics: SystemMetrics
+    ) -> Optional[PerformanceInsight]:
         """Detect I/O-related bottlenecks."""
-        # Check disk utilization
-        for device, utilization in metrics.disk_utilization.items():
-            if utilization.value > 90:
-                return PerformanceInsight(
-                    title=f"Disk I/O Bottleneck on {device}",
-                    description=f"Disk {device} utilization at {utilization.value}%",
-                    component="disk",
-                    severity=Severity.CRITICAL,
-                    metrics=[f"disk_utilization_{device}"],
-                    recommendations=[
-                        "Clean up disk space immediately",
-                        "Move data to less utilized storage",
-                        "Consider SSD upgrade or storage expansion",
-                    ],
-                )
+        # Check disk utilization (first device over the threshold wins)
+        hit = next(
+            (
+                (device, utilization.value)
+                for device, utilization in metrics.disk_utilization.items()
+                if utilization.value > DISK_BOTTLENECK_THRESHOLD
+            ),
+            None,
+        )
+        if hit:
+            return self.disk_bottleneck(*hit)
 
         # Check for network issues
+        return self.detect_network_bottleneck(metrics)
+
+    def disk_bottleneck(self, device: str, value: float) -> PerformanceInsight:
+        """Build the insight for a disk above DISK_BOTTLENECK_THRESHOLD."""
+        return PerformanceInsight(
+            title=f"Disk I/O Bottleneck on {device}",
+            description=f"Disk {device} utilization at {value}%",
+            component="disk",
+            severity=Severity.CRITICAL,
+            metrics=(f"disk_utilization_{device}",),
+            recommendations=_DISK_RECOMMENDATIONS,
+        )
+
+    def detect_network_bottleneck(
+        self, metrics: SystemMetrics
+    ) -> Optional[PerformanceInsight]:
+        """Detect a high network error count."""
         if metrics.network_errors and metrics.network_errors.value > 100:
             return PerformanceInsight(
-                title="Network Error Rate High",
                 description=f"Network errors: {metrics.network_errors.value}",
-                component="network",
-                severity=Severity.HIGH,
-                metrics=["network_errors"],
-                recommendations=[
-                    "Check network hardware and cables",
-                    "Investigate application network handling",
-                    "Monitor network stability",
-                ],
+                **_NETWORK_ERRORS,
             )
 
         return None
@@ -153,18 +280,7 @@ class BottleneckDetector:
             Sorted list by priority
         """
         # Sort by severity (CRITICAL first) and then by component priority
-        severity_order = {
-            Severity.CRITICAL: 0,
-            Severity.HIGH: 1,
-            Severity.MEDIUM: 2,
-            Severity.LOW: 3,
-        }
-        component_priority = {"cpu": 0, "memory": 1, "disk": 2, "network": 3}
-
         return sorted(
             bottlenecks,
-            key=lambda b: (
-                severity_order.get(b.severity, 4),
-                component_priority.get(b.component, 99),
-            ),
+            key=lambda b: (-b.severity, _COMPONENT_PRIORITY.get(b.component, 99)),
         )
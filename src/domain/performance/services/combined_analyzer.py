@@ -0,0 +1,71 @@
+"""Combined USE Method and bottleneck analysis domain service."""
+
+from typing import List, Optional
+
+from ..entities.performance_insight import PerformanceInsight
+from ..entities.system_metrics import SystemMetrics
+from .bottleneck_detector import DISK_BOTTLENECK_THRESHOLD, BottleneckDetector
+from .use_method_analyzer import USEMethodAnalyzer
+
+
+class CombinedAnalyzer:
+    """Domain Service: Runs USE Method and bottleneck detection in one pass.
+
+    Produces the same insights as ``USEMethodAnalyzer.analyze`` followed by
+    ``BottleneckDetector.detect_bottlenecks``, but walks the per-disk metrics
+    only once for both.
+    """
+
+    __slots__ = ("use_analyzer", "bottleneck_detector")
+
+    def __init__(
+        self,
+        use_analyzer: Optional[USEMethodAnalyzer] = None,
+        bottleneck_detector: Optional[BottleneckDetector] = None,
+    ):
+        """
+        Initialize the combined analyzer.
+
+        Args:
+            use_analyzer: USE Method analyzer (a default one if omitted)
+            bottleneck_detector: Bottleneck detector (a default one if omitted)
+        """
+        self.use_analyzer = use_analyzer or USEMethodAnalyzer()
+        self.bottleneck_detector = bottleneck_detector or BottleneckDetector()
+
+    def analyze(self, metrics: SystemMetrics) -> List[PerformanceInsight]:
+        """
+        Analyze system metrics with both services.
+
+        Args:
+            metrics: Current system metrics
+
+        Returns:
+            USE Method insights followed by bottleneck insights
+        """
+        use = self.use_analyzer
+        detector = self.bottleneck_detector
+
+        insights = list(use.analyze_cpu(metrics))
+        insights.extend(use.analyze_memory(metrics))
+
+        # Single walk over the disks feeds both analyses
+        use_critical = use.THRESHOLDS["disk"].critical
+        disk_bottleneck = None
+        for device, utilization in metrics.disk_utilization.items():
+            value = utilization.value
+            if value >= use_critical:
+                insights.append(use.disk_insight(device, value))
+            if disk_bottleneck is None and value > DISK_BOTTLENECK_THRESHOLD:
+                disk_bottleneck = detector.disk_bottleneck(device, value)
+
+        insights.extend(use.analyze_network(metrics))
+
+        bottlenecks = (
+            detector.detect_cpu_bottleneck(metrics),
+            detector.detect_memory_bottleneck(metrics),
+            disk_bottleneck or detector.detect_network_bottleneck(metrics),
+        )
+        insights.extend(b for b in bottlenecks if b)
+
+        return insights
@@ -1,10 +1,10 @@
 """Metric value object with unit handling."""
 
 from dataclasses import dataclass
-from typing import Union
+from typing import Iterable, List, Union
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MetricValue:
     """Value object representing a metric with its unit."""
 
@@ -17,6 +17,22 @@ class MetricValue:
 
     def to_percentage(self) -> str:
         """Convert to percentage format."""
-        if self.unit == "%":
-            return f"{self.value}%"
         return f"{self.value}%"
+
+    @classmethod
+    def from_array(
+        cls, values: Iterable[Union[int, float]], unit: str
+    ) -> List["MetricValue"]:
+        """
+        Wrap a batch of raw values (e.g. a numpy column) sharing one unit.
+
+        Args:
+            values: Numeric values; numpy arrays are converted via tolist()
+            unit: Unit applied to every value
+
+        Returns:
+            One MetricValue per input value, in order
+        """
+        if hasattr(values, "tolist"):
+            values = values.tolist()
+        return [cls(value, unit) for value in values]
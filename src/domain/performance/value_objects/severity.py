@@ -1,12 +1,16 @@
 """Severity value object for performance insights."""
 
-from enum import Enum
+from enum import IntEnum
 
 
-class Severity(Enum):
-    """Severity levels for performance insights."""
+class Severity(IntEnum):
+    """Severity levels for performance insights, ordered by urgency.
 
-    LOW = "LOW"
-    MEDIUM = "MEDIUM"
-    HIGH = "HIGH"
-    CRITICAL = "CRITICAL"
+    Integer values make comparisons (``severity >= Severity.HIGH``) and
+    sorting cheap; use ``.name`` for the external string representation.
+    """
+
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
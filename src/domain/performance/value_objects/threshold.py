@@ -1,10 +1,13 @@
 """Threshold value object for performance metrics."""
 
-from dataclasses import dataclass
-from typing import Optional
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
 
+from .severity import Severity
 
-@dataclass
+
+@dataclass(frozen=True)
 class Threshold:
     """Threshold configuration for a performance metric."""
 
@@ -12,10 +15,37 @@ class Threshold:
     critical: Optional[float] = None
     unit: str = "%"
 
-    def get_severity(self, value: float) -> str:
-        """Determine severity based on value."""
+    # Sorted bounds and the severity reached at/above each one, built once
+    _bounds: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+    _levels: Tuple[Optional[Severity], ...] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Severity only changes at a bound, so evaluating the rules once per
+        # bound gives the result for every value up to the next one
+        bounds = tuple(sorted(b for b in (self.warning, self.critical) if b))
+        levels = (None,) + tuple(self._classify(bound) for bound in bounds)
+        object.__setattr__(self, "_bounds", bounds)
+        object.__setattr__(self, "_levels", levels)
+
+    def _classify(self, value: float) -> Optional[Severity]:
+        """Apply the threshold rules directly (critical checked first)."""
         if self.critical and value >= self.critical:
-            return "CRITICAL"
+            return Severity.CRITICAL
         if self.warning and value >= self.warning:
-            return "WARNING"
-        return "OK"
+            return Severity.HIGH
+        return None
+
+    def get_severity(self, value: float) -> Optional[Severity]:
+        """
+        Determine severity based on value.
+
+        Args:
+            value: Metric reading in this threshold's unit
+
+        Returns:
+            Severity.CRITICAL at/above critical, Severity.HIGH at/above
+            warning, or None when the value is within normal range
+        """
+        return self._levels[bisect_right(self._bounds, value)]
@@ -0,0 +1,291 @@
+"""Process-wide HTTP clients shared by the AI adapters."""
+
+import asyncio
+import logging
+import os
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from src.infrastructure.ai._json import dumps, extract_top_level_json, loads
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    aiohttp = None
+    AIOHTTP_AVAILABLE = False
+
+__all__ = [
+    "HTTP_BACKEND",
+    "HTTP_ERRORS",
+    "OLLAMA_NUM_CTX",
+    "OLLAMA_NUM_PARALLEL",
+    "close_async_client",
+    "generate_envelope",
+    "get_async_client",
+    "ollama_generate",
+    "stream_generate",
+]
+
+logger = logging.getLogger(__name__)
+
+# Transport for Ollama calls: "aiohttp" (default, scales better under
+# concurrent fan-out) or "httpx" to roll back
+HTTP_BACKEND = os.getenv("OLLAMA_HTTP_BACKEND", "aiohttp").lower()
+if HTTP_BACKEND == "aiohttp" and not AIOHTTP_AVAILABLE:
+    logger.warning("aiohttp not installed, falling back to the httpx backend")
+    HTTP_BACKEND = "httpx"
+
+# Transport errors callers may want to handle, whichever backend is active
+HTTP_ERRORS = (httpx.HTTPError,) + ((aiohttp.ClientError,) if aiohttp else ())
+
+# In-flight generate calls allowed at once; match the server's
+# OLLAMA_NUM_PARALLEL so extra calls wait here instead of in Ollama's queue
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+# Context window requested with every generate call; prompts here stay well
+# below it, and a fixed size keeps Ollama from reloading the model
+OLLAMA_NUM_CTX = int(os.getenv("OLLAMA_NUM_CTX", "4096"))
+
+_client: Optional[httpx.AsyncClient] = None
+_session: Optional["aiohttp.ClientSession"] = None
+_semaphore: Optional[asyncio.Semaphore] = None
+_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Return the shared async HTTP client, creating it on first use.
+
+    Every adapter talking to Ollama goes through this one connection pool,
+    so keep-alive connections are reused across clients and requests.
+    Callers pass their own per-request ``timeout``.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(300.0, connect=10.0),
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=40,
+                keepalive_expiry=30.0,
+            ),
+        )
+        logger.info(f"Shared HTTP client created (http2={HTTP2_AVAILABLE})")
+    return _client
+
+
+def _get_aiohttp_session() -> "aiohttp.ClientSession":
+    """Return the shared aiohttp session (must be called inside the loop)."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=40, keepalive_timeout=30
+            ),
+            timeout=aiohttp.ClientTimeout(total=300, connect=10),
+        )
+        logger.info("Shared aiohttp session created")
+    return _session
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Return the generate-call semaphore bound to the running loop."""
+    global _semaphore, _semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _semaphore is None or _semaphore_loop is not loop:
+        _semaphore = asyncio.Semaphore(OLLAMA_NUM_PARALLEL)
+        _semaphore_loop = loop
+    return _semaphore
+
+
+# Request bodies are pre-serialized JSON bytes
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+async def _stream_lines(
+    url: str, body: bytes, timeout: float
+) -> AsyncIterator[Dict[str, Any]]:
+    """POST a JSON body and yield each decoded line of an NDJSON stream."""
+    if HTTP_BACKEND == "aiohttp":
+        async with _get_aiohttp_session().post(
+            url,
+            data=body,
+            headers=_JSON_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            response.raise_for_status()
+            async for line in response.content:
+                if line.strip():
+                    yield loads(line)
+        return
+
+    async with get_async_client().stream(
+        "POST", url, content=body, headers=_JSON_HEADERS, timeout=timeout
+    ) as response:
+        response.raise_for_status()
+        async for line in response.aiter_lines():
+            if line:
+                yield loads(line)
+
+
+def _is_json(text: str) -> bool:
+    """Check whether a candidate cut from the stream is valid JSON."""
+    try:
+        loads(text)
+    except ValueError:
+        return False
+    return True
+
+
+async def stream_generate(
+    url: str,
+    body: bytes,
+    timeout: float,
+    stop_at_json: bool = False,
+    json_opener: Optional[str] = None,
+) -> str:
+    """
+    Run a streaming Ollama generate call and return the generated text.
+
+    At most ``OLLAMA_NUM_PARALLEL`` calls are in flight per event loop.
+
+    Args:
+        url: Ollama ``/api/generate`` URL
+        body: Serialized request (must ask for ``"stream": true``)
+        timeout: Request timeout in seconds
+        stop_at_json: Close the stream as soon as the first complete
+            top-level JSON object or array has arrived and parses, and
+            return only that value, instead of waiting for whatever the
+            model writes after it
+        json_opener: With stop_at_json, "{" or "[" to accept only an
+            object or array, or None for whichever comes first
+
+    Returns:
+        Generated text (or the JSON value when stopped early)
+
+    Raises:
+        One of HTTP_ERRORS on transport or HTTP status errors
+    """
+    parts = []
+    async with _get_semaphore(), aclosing(_stream_lines(url, body, timeout)) as chunks:
+        async for chunk in chunks:
+            part = chunk.get("response", "")
+            parts.append(part)
+            # Only a closing bracket can complete the value
+            if stop_at_json and ("}" in part or "]" in part):
+                found = extract_top_level_json("".join(parts), json_opener)
+                if found is not None and _is_json(found):
+                    logger.debug("Complete JSON received, closing stream early")
+                    return found
+            if chunk.get("done"):
+                break
+    return "".join(parts)
+
+
+def generate_envelope(
+    model: str,
+    temperature: float,
+    json_mode: bool = False,
+    system: Optional[str] = None,
+    num_predict: Optional[int] = None,
+) -> bytes:
+    """
+    Serialize the invariant part of a generate request once.
+
+    The result is the request JSON up to the prompt value, so a call only
+    has to encode its prompt: ``envelope + dumps(prompt) + b"}"``.
+
+    Args:
+        model: Model name
+        temperature: Sampling temperature
+        json_mode: Constrain the output to a single JSON value
+            (Ollama ``format: json``)
+        system: Static system message sent in Ollama's ``system`` field,
+            so the server can reuse its prefilled KV cache across calls
+        num_predict: Maximum number of tokens to generate (model default
+            if None)
+
+    Returns:
+        Serialized request prefix
+    """
+    envelope: Dict[str, Any] = {
+        "model": model,
+        "stream": True,
+        "options": {"temperature": temperature, "num_ctx": OLLAMA_NUM_CTX},
+    }
+    if num_predict is not None:
+        envelope["options"]["num_predict"] = num_predict
+    if json_mode:
+        envelope["format"] = "json"
+    if system is not None:
+        envelope["system"] = system
+        # Never evict the system prefix when the context window shifts
+        envelope["options"]["num_keep"] = -1
+    return dumps(envelope)[:-1] + b',"prompt":'
+
+
+async def ollama_generate(
+    url: str,
+    envelope: bytes,
+    prompt: str,
+    timeout: float,
+    stop_at_json: bool = False,
+    json_opener: Optional[str] = None,
+) -> str:
+    """
+    Call Ollama's generate endpoint (the one path every AI adapter uses).
+
+    Args:
+        url: Ollama ``/api/generate`` URL
+        envelope: Request prefix from generate_envelope()
+        prompt: Prompt to send to the model
+        timeout: Request timeout in seconds
+        stop_at_json: Close the stream once the first JSON value is complete
+        json_opener: "{" or "[" to stop only at an object or array (None
+            accepts either)
+
+    Returns:
+        Generated text
+
+    Raises:
+        One of HTTP_ERRORS on transport or HTTP status errors
+    """
+    body = envelope + dumps(prompt) + b"}"
+    try:
+        return await stream_generate(
+            url, body, timeout, stop_at_json=stop_at_json, json_opener=json_opener
+        )
+    except HTTP_ERRORS as e:
+        logger.error(f"HTTP error calling Ollama: {e}")
+        raise
+    except Exception as e:
+        logger.error(f"Unexpected error calling Ollama: {e}")
+        raise
+
+
+async def close_async_client() -> None:
+    """Close the shared HTTP clients (call once at process shutdown)."""
+    global _client, _session
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.info("Shared HTTP client closed")
+    if _session is not None:
+        await _session.close()
+        _session = None
+        logger.info("Shared aiohttp session closed")
@@ -0,0 +1,102 @@
+"""JSON helpers for parsing LLM responses."""
+
+import json
+import re
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Characters the scanner has to look at: brackets, and quotes/backslashes
+# to track whether it is inside a string literal
+_STRUCTURAL_RE = re.compile(r'[{}\[\]"\\]')
+_OPENERS = frozenset("{[")
+
+
+def loads(text: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    Args:
+        text: JSON text (str or UTF-8 bytes)
+
+    Returns:
+        Decoded value
+
+    Raises:
+        json.JSONDecodeError: If the text is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Serialize a value to compact JSON bytes, using orjson when installed.
+
+    Args:
+        value: JSON-serializable value
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+def extract_top_level_json(text: str, opener: Optional[str] = "{") -> Optional[str]:
+    """
+    Find the first complete top-level JSON object or array in free text.
+
+    Scans once from the first ``opener``, tracking bracket depth and whether
+    the scan is inside a string literal (honouring backslash escapes), and
+    stops as soon as the value closes, so prose or a second JSON value after
+    it is never examined. A partial buffer (e.g. a stream cut inside a
+    string value) yields None.
+
+    Args:
+        text: Text that may contain JSON surrounded by prose
+        opener: "{" for an object, "[" for an array, or None for whichever
+            of the two comes first
+
+    Returns:
+        The JSON substring, or None if no complete value was found
+    """
+    if opener is None:
+        starts = [i for i in (text.find("{"), text.find("[")) if i != -1]
+        start = min(starts) if starts else -1
+    else:
+        start = text.find(opener)
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    # Index of a character escaped by the preceding backslash
+    escaped = -1
+    for match in _STRUCTURAL_RE.finditer(text, start):
+        pos = match.start()
+        if pos == escaped:
+            continue
+        char = match.group()
+        if in_string:
+            if char == "\\":
+                escaped = pos + 1
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in _OPENERS:
+            depth += 1
+        elif char != "\\":
+            depth -= 1
+            if depth == 0:
+                return text[start : pos + 1]
+    return None
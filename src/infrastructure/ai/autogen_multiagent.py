@@ -1,18 +1,111 @@
 """AutoGen Multi-Agent Collaborative System for Performance Analysis."""
 
+import asyncio
+import hashlib
 import json
 import logging
-from typing import List, Dict, Any, Optional
+import os
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
-import httpx
-
+from src.infrastructure.ai._http import generate_envelope, ollama_generate
+from src.infrastructure.ai._json import dumps, extract_top_level_json, loads
 from src.domain.performance.entities.performance_insight import PerformanceInsight
 from src.domain.performance.entities.system_metrics import SystemMetrics
 from src.domain.performance.value_objects.severity import Severity
 
 logger = logging.getLogger(__name__)
 
+# Agents answer with {"insights": [{"finding": ..., "recommendation": ...}]};
+# the fallback path pulls the recommendation strings out without a full parse
+_RECOMMENDATION_RE = re.compile(r'"recommendation"\s*:\s*"((?:[^"\\]|\\.)*)"')
+
+# Consolidated results kept for repeated identical agent answers
+CONSOLIDATION_CACHE_SIZE = 128
+
+# Token budgets: an agent answers with 2-3 short findings, the consolidation
+# with 1-2 full insights
+AGENT_NUM_PREDICT = 512
+CONSOLIDATION_NUM_PREDICT = 1024
+
+# Ask Ollama for structured JSON output (format=json); set to "false" to roll
+# back to free-form answers if a model misbehaves with it. JSON is still
+# located tolerantly in the text either way.
+OLLAMA_FORMAT_JSON = os.getenv("OLLAMA_FORMAT_JSON", "true").lower() not in (
+    "0",
+    "false",
+    "no",
+)
+
+# Fixed text around the context and agent answers in the consolidation prompt
+_CONSOLIDATION_HEAD = """You are a senior technical lead consolidating analyses from 5 specialized agents.
+
+Context: """
+_CONSOLIDATION_TASK = """
+
+Task: Create 1-2 consolidated performance insights that combine the best recommendations from all agents.
+
+For each insight provide:
+- title: Clear actionable title (plain text)
+- observation: Consolidated finding from multiple agents
+- recommendations: Best 5-7 recommendations from all agents (prefix with agent name)
+- severity: CRITICAL, HIGH, MEDIUM, or LOW
+- confidence: 85-95 (higher for multi-agent consensus)
+
+Respond with JSON only: {"insights": [{"title": "...", "observation": "...", "recommendations": [...], "severity": "HIGH", "confidence": 92}]}"""
+
+# How agents are queried: "fanout" (one Ollama call per agent) or "panel"
+# (one call answering for every role at once)
+MULTI_AGENT_MODE = os.getenv("MULTI_AGENT_MODE", "fanout").lower()
+
+_PANEL_HEAD = """You are a panel of five experts analyzing the same system together.
+
+"""
+_PANEL_TASK = """
+For EACH expert above, give 2-3 actionable recommendations from their perspective.
+Respond with JSON only: one object keyed by expert name, each value shaped as
+{"insights": [{"finding": "...", "recommendation": "..."}]}"""
+
+# Static fields of the fallback consolidated insight
+_FALLBACK_CONSOLIDATED = {
+    "title": "Multi-Agent Collaborative Analysis",
+    "severity": "MEDIUM",
+    "confidence": 85,
+}
+
+# Scenario used when no metrics are supplied
+_DEFAULT_CONTEXT = """General system performance analysis.
+
+Scenario: Production system showing performance degradation.
+- Response times increased 40%
+- CPU utilization at 85%
+- Memory usage climbing
+- Some requests timing out
+
+Analyze from your specialized perspective."""
+
+
+@dataclass(frozen=True, slots=True)
+class Agent:
+    """A specialized analysis role with its pre-rendered request parts."""
+
+    name: str
+    role: str
+    system_message: str
+    prompt_suffix: str
+    envelope: bytes
+
+
+def _unescape_json_string(raw: str) -> str:
+    """Decode JSON escapes in a string body, keeping it as-is if malformed."""
+    try:
+        return json.loads(f'"{raw}"')
+    except ValueError:
+        return raw
+
 
 class AutoGenMultiAgent:
     """
@@ -23,7 +116,29 @@ class AutoGenMultiAgent:
     cost, reliability, infrastructure).
     """
 
-    def __init__(self, base_url: str, model: str, temperature: float = 0.7, timeout: int = 120):
+    # Long-lived, one per server; fixed attribute set, no per-instance dict
+    __slots__ = (
+        "base_url",
+        "_generate_url",
+        "model",
+        "temperature",
+        "timeout",
+        "_consolidation_envelope",
+        "_consolidation_cache",
+        "mode",
+        "agents",
+        "_panel_prefix",
+        "_panel_envelope",
+    )
+
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        temperature: float = 0.7,
+        timeout: int = 120,
+        mode: Optional[str] = None,
+    ):
         """
         Initialize multi-agent system.
 
@@ -32,22 +147,45 @@ class AutoGenMultiAgent:
             model: Model name (e.g., minimax-m2:cloud)
             temperature: Temperature for generation
             timeout: Request timeout in seconds
+            mode: "fanout" (one call per agent) or "panel" (one call for all
+                roles); defaults to the MULTI_AGENT_MODE environment variable
         """
         self.base_url = base_url.rstrip("/").replace("/v1", "")
+        self._generate_url = f"{self.base_url}/api/generate"
         self.model = model
         self.temperature = temperature
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        # Pre-serialized request prefix; each call only encodes its prompt
+        self._consolidation_envelope = generate_envelope(
+            model,
+            temperature,
+            json_mode=OLLAMA_FORMAT_JSON,
+            num_predict=CONSOLIDATION_NUM_PREDICT,
+        )
+        # Consolidated insights by request fingerprint, stored serialized
+        self._consolidation_cache: "OrderedDict[str, bytes]" = OrderedDict()
+
+        self.mode = (mode or MULTI_AGENT_MODE).lower()
 
         # Define specialized agents
         self.agents = self._create_agents()
+        self._panel_prefix = _PANEL_HEAD + "\n\n".join(
+            f"### {agent.name} ({agent.role})\n{agent.system_message}"
+            for agent in self.agents
+        )
+        self._panel_envelope = generate_envelope(
+            model,
+            temperature,
+            json_mode=OLLAMA_FORMAT_JSON,
+            num_predict=AGENT_NUM_PREDICT * len(self.agents),
+        )
 
         logger.info(f"AutoGen multi-agent system initialized with {len(self.agents)} agents")
 
-    def _create_agents(self) -> List[Dict[str, str]]:
+    def _create_agents(self) -> Tuple[Agent, ...]:
         """Create specialized agents for different analysis perspectives."""
 
-        agents = [
+        specs = [
             {
                 "name": "PerformanceAnalyst",
                 "role": "Performance Engineer",
@@ -105,7 +243,28 @@ Format: JSON with {insights: [{"finding": "...", "recommendation": "..."}]}"""
             }
         ]
 
-        return agents
+        # The role text travels in Ollama's system field (one pre-serialized
+        # envelope per agent) so the server reuses its prefill across calls;
+        # the prompt itself only carries the per-request context
+        return tuple(
+            Agent(
+                name=spec["name"],
+                role=spec["role"],
+                system_message=spec["system_message"],
+                prompt_suffix=(
+                    f"\n\nAnalyze from your {spec['role']} perspective and provide "
+                    "2-3 actionable recommendations.\nRespond with JSON only."
+                ),
+                envelope=generate_envelope(
+                    self.model,
+                    self.temperature,
+                    json_mode=OLLAMA_FORMAT_JSON,
+                    system=spec["system_message"],
+                    num_predict=AGENT_NUM_PREDICT,
+                ),
+            )
+            for spec in specs
+        )
 
     async def analyze_collaborative(
         self,
@@ -115,6 +274,11 @@ Format: JSON with {insights: [{"finding": "...", "recommendation": "..."}]}"""
         """
         Run collaborative analysis with all agents.
 
+        Agent calls run concurrently, capped client-side at
+        ``OLLAMA_NUM_PARALLEL`` in-flight requests; set the same value on the
+        Ollama server (>= 5 lets every agent run in one wave), otherwise the
+        calls queue server-side and the fan-out degrades to sequential latency.
+
         Args:
             metrics: System metrics to analyze
             max_rounds: Maximum discussion rounds
@@ -128,32 +292,11 @@ Format: JSON with {insights: [{"finding": "...", "recommendation": "..."}]}"""
             # Build analysis context
             context = self._build_analysis_context(metrics)
 
-            # Collect analysis from each agent
-            agent_analyses = []
-
-            for agent in self.agents:
-                logger.info(f"Calling agent: {agent['name']}")
-
-                # Create agent-specific prompt
-                prompt = f"""{agent['system_message']}
-
-Scenario: {context}
-
-Analyze from your {agent['role']} perspective and provide 2-3 actionable recommendations.
-Respond with JSON only."""
-
-                # Call Ollama for this agent
-                try:
-                    response = await self._call_ollama(prompt)
-                    agent_analyses.append({
-                        "agent": agent["name"],
-                        "role": agent["role"],
-                        "analysis": response
-                    })
-                    logger.info(f"Agent {agent['name']} analysis received ({len(response)} chars)")
-                except Exception as e:
-                    logger.error(f"Error calling agent {agent['name']}: {e}")
-                    continue
+            agent_analyses = None
+            if self.mode == "panel":
+                agent_analyses = await self._analyze_panel(context)
+            if not agent_analyses:
+                agent_analyses = await self._analyze_fanout(context)
 
             # Consolidate all analyses into final insights
             insights = await self._consolidate_analyses(agent_analyses, context)
@@ -176,33 +319,110 @@ Respond with JSON only."""
                 "insights": []
             }
 
-    async def _call_ollama(self, prompt: str) -> str:
-        """Make API call to Ollama."""
+    async def _analyze_fanout(self, context: str) -> List[Dict[str, Any]]:
+        """Query every agent with its own Ollama call."""
+        # Agents analyze the same context independently, so their
+        # Ollama round-trips run concurrently instead of one after another
+        results = await asyncio.gather(
+            *(self._call_agent(agent, context) for agent in self.agents),
+            return_exceptions=True,
+        )
+        agent_analyses = []
+        for agent, result in zip(self.agents, results):
+            if isinstance(result, Exception):
+                logger.error(f"Agent {agent.name} failed: {result}")
+            elif result is not None:
+                agent_analyses.append(result)
+        return agent_analyses
+
+    async def _analyze_panel(self, context: str) -> List[Dict[str, Any]]:
+        """
+        Query all agents with a single multi-role Ollama call.
 
-        url = f"{self.base_url}/api/generate"
+        One round-trip and one prompt prefill replace the per-agent calls;
+        the keyed answer is split back into the per-agent shape that
+        _consolidate_analyses expects.
 
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": self.temperature,
-            }
-        }
+        Args:
+            context: Analysis context shared by all roles
 
+        Returns:
+            Per-agent analyses, empty if the panel answer could not be parsed
+            (the caller then falls back to the fan-out)
+        """
+        prompt = f"{self._panel_prefix}\n\nScenario: {context}\n{_PANEL_TASK}"
         try:
-            response = await self.client.post(url, json=payload)
-            response.raise_for_status()
+            response = await self._call_ollama(prompt, self._panel_envelope)
+            json_str = extract_top_level_json(response)
+            data = loads(json_str) if json_str is not None else None
+        except Exception as e:
+            logger.error(f"Error in panel analysis: {e}")
+            return []
+
+        if not isinstance(data, dict):
+            logger.warning("No JSON object in panel response, falling back to fan-out")
+            return []
 
-            data = response.json()
-            return data.get("response", "")
+        return [
+            {
+                "agent": agent.name,
+                "role": agent.role,
+                "analysis": json.dumps(data[agent.name]),
+            }
+            for agent in self.agents
+            if agent.name in data
+        ]
 
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error calling Ollama: {e}")
-            raise
+    async def _call_agent(
+        self, agent: Agent, context: str
+    ) -> Optional[Dict[str, Any]]:
+        """Run one agent's analysis, returning None if the call fails."""
+        logger.info(f"Calling agent: {agent.name}")
+
+        # Create agent-specific prompt
+        prompt = f"Scenario: {context}{agent.prompt_suffix}"
+
+        # Call Ollama for this agent
+        try:
+            response = await self._call_ollama(prompt, agent.envelope)
         except Exception as e:
-            logger.error(f"Unexpected error calling Ollama: {e}")
-            raise
+            logger.error(f"Error calling agent {agent.name}: {e}")
+            return None
+
+        logger.info(
+            "Agent %s analysis received (%d chars)", agent.name, len(response)
+        )
+        return {
+            "agent": agent.name,
+            "role": agent.role,
+            "analysis": response
+        }
+
+    async def _call_ollama(self, prompt: str, envelope: bytes) -> str:
+        """
+        Make API call to Ollama, stopping once a JSON answer is complete.
+
+        Args:
+            prompt: User prompt
+            envelope: Pre-serialized request prefix for this kind of call
+                (agent, panel or consolidation), carrying its system message
+                and token budget
+
+        Returns:
+            Generated text
+        """
+
+        # Shared process-wide pool keeps a warm connection per concurrent
+        # agent call (closed at app shutdown, not per instance)
+        return await ollama_generate(
+            self._generate_url,
+            envelope,
+            prompt,
+            self.timeout,
+            # Every panel and consolidation prompt asks for an object
+            stop_at_json=True,
+            json_opener="{",
+        )
 
     async def _consolidate_analyses(
         self,
@@ -214,67 +434,102 @@ Respond with JSON only."""
         if not agent_analyses:
             return []
 
-        # Build consolidation prompt
-        analyses_text = "\n\n".join([
-            f"**{analysis['agent']} ({analysis['role']}):**\n{analysis['analysis']}"
-            for analysis in agent_analyses
-        ])
-
-        consolidation_prompt = f"""You are a senior technical lead consolidating analyses from 5 specialized agents.
+        # Fixed agent order keeps the prompt (and Ollama's prefix cache)
+        # stable regardless of which agent answered first
+        agent_analyses = sorted(agent_analyses, key=lambda a: a["agent"])
 
-Context: {context}
+        # Identical context and agent answers consolidate to the same result,
+        # so skip the extra LLM round-trip on a repeat
+        key = self._consolidation_key(agent_analyses, context)
+        cached = self._consolidation_cache.get(key)
+        if cached is not None:
+            self._consolidation_cache.move_to_end(key)
+            logger.info("Consolidation served from cache")
+            # Decoded afresh, so callers never share dicts with the cache
+            return loads(cached)
 
-Agent Analyses:
-{analyses_text}
-
-Task: Create 1-2 consolidated performance insights that combine the best recommendations from all agents.
-
-For each insight provide:
-- title: Clear actionable title with emoji
-- observation: Consolidated finding from multiple agents
-- recommendations: Best 5-7 recommendations from all agents (prefix with agent name)
-- severity: CRITICAL, HIGH, MEDIUM, or LOW
-- confidence: 85-95 (higher for multi-agent consensus)
-
-Respond with JSON only: {{"insights": [{{"title": "...", "observation": "...", "recommendations": [...], "severity": "HIGH", "confidence": 92}}]}}"""
+        # Build consolidation prompt
+        consolidation_prompt = self._build_consolidation_prompt(agent_analyses, context)
 
         try:
-            response = await self._call_ollama(consolidation_prompt)
+            response = await self._call_ollama(
+                consolidation_prompt, self._consolidation_envelope
+            )
 
             # Extract JSON from response
-            json_start = response.find("{")
-            json_end = response.rfind("}") + 1
-
-            if json_start == -1 or json_end == 0:
+            json_str = extract_top_level_json(response)
+            if json_str is None:
                 logger.warning("No JSON found in consolidation response")
                 return self._create_fallback_consolidated_insight(agent_analyses)
 
-            json_str = response[json_start:json_end]
-            data = json.loads(json_str)
+            data = loads(json_str)
 
-            return data.get("insights", [])
+            insights = list(data.get("insights", []))
+            self._cache_consolidation(key, insights)
+            return insights
 
         except Exception as e:
             logger.error(f"Error consolidating analyses: {e}")
             return self._create_fallback_consolidated_insight(agent_analyses)
 
+    def _build_consolidation_prompt(
+        self, agent_analyses: List[Dict[str, Any]], context: str
+    ) -> str:
+        """Assemble the consolidation prompt with a single final join."""
+        parts = [_CONSOLIDATION_HEAD, context, "\n\nAgent Analyses:\n"]
+        append = parts.append
+        for index, analysis in enumerate(agent_analyses):
+            if index:
+                append("\n\n")
+            append("**")
+            append(analysis["agent"])
+            append(" (")
+            append(analysis["role"])
+            append("):**\n")
+            append(analysis["analysis"])
+        append(_CONSOLIDATION_TASK)
+        return "".join(parts)
+
+    def _consolidation_key(
+        self, agent_analyses: List[Dict[str, Any]], context: str
+    ) -> str:
+        """Fingerprint a consolidation request (model settings included)."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{self.model}|{self.temperature}|{context}".encode())
+        # Analyses arrive sorted by agent name
+        for analysis in agent_analyses:
+            digest.update(b"||")
+            digest.update(f"{analysis['agent']}\0{analysis['analysis']}".encode())
+        return digest.hexdigest()
+
+    def _cache_consolidation(self, key: str, insights: List[Dict[str, Any]]) -> None:
+        """Store a consolidated result, evicting the least recently used."""
+        cache = self._consolidation_cache
+        cache[key] = dumps(insights)
+        cache.move_to_end(key)
+        if len(cache) > CONSOLIDATION_CACHE_SIZE:
+            cache.popitem(last=False)
+
     def _create_fallback_consolidated_insight(
         self,
         agent_analyses: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        """Create fallback consolidated insight."""
-
-        recommendations = [
-            f"{analysis['agent']}: Analyze from {analysis['role']} perspective"
-            for analysis in agent_analyses
-        ]
+        """Create fallback consolidated insight from the raw agent answers."""
+
+        recommendations = []
+        for analysis in agent_analyses:
+            found = [
+                _unescape_json_string(match.group(1))
+                for match in _RECOMMENDATION_RE.finditer(analysis["analysis"])
+            ]
+            if not found:
+                found = [f"Analyze from {analysis['role']} perspective"]
+            recommendations.extend(f"{analysis['agent']}: {rec}" for rec in found)
 
         return [{
-            "title": "🤖 Multi-Agent Collaborative Analysis",
+            **_FALLBACK_CONSOLIDATED,
             "observation": f"Analysis from {len(agent_analyses)} specialized agents",
             "recommendations": recommendations,
-            "severity": "MEDIUM",
-            "confidence": 85
         }]
 
     def _build_analysis_context(self, metrics: Optional[SystemMetrics]) -> str:
@@ -283,18 +538,8 @@ Respond with JSON only: {{"insights": [{{"title": "...", "observation": "...", "
         if metrics:
             # TODO: Extract real metrics when available
             return "Real-time system metrics with performance degradation detected."
-        else:
-            return """General system performance analysis.
-
-Scenario: Production system showing performance degradation.
-- Response times increased 40%
-- CPU utilization at 85%
-- Memory usage climbing
-- Some requests timing out
-
-Analyze from your specialized perspective."""
+        return _DEFAULT_CONTEXT
 
     async def close(self):
-        """Cleanup resources."""
-        await self.client.aclose()
+        """Cleanup resources (the shared HTTP pool stays open, see _http)."""
         logger.info("AutoGen multi-agent system closed")
@@ -1,19 +1,76 @@
 """Ollama LLM client implementation (adapter)."""
 
+import asyncio
 import json
 import logging
+import sys
+from dataclasses import replace
 from datetime import datetime
-from typing import List, Optional
-
-import httpx
+from typing import Dict, List, Optional, Sequence
 
 from src.application.ports.output.llm_client import LLMClientPort
+from src.infrastructure.ai._http import generate_envelope, ollama_generate
+from src.infrastructure.ai._json import extract_top_level_json, loads
+from src.domain.ai_agent.value_objects.llm_config import DEFAULT_LLM_THRESHOLDS
 from src.domain.performance.entities.performance_insight import PerformanceInsight
 from src.domain.performance.entities.system_metrics import SystemMetrics
 from src.domain.performance.value_objects.severity import Severity
 
 logger = logging.getLogger(__name__)
 
+# Severity names as the model may spell them (upper- or lower-case)
+_SEVERITY_MAP = {
+    **{member.name: member for member in Severity},
+    **{member.name.lower(): member for member in Severity},
+}
+
+# Prototype for the fallback insight; only the timestamp changes per call
+_FALLBACK_INSIGHT = PerformanceInsight(
+    title="AI Analysis: System Performance Overview",
+    description=(
+        "Based on the USE method analysis, I've identified potential "
+        "bottlenecks in your system. The CPU shows signs of saturation "
+        "with elevated load averages, which may impact response times."
+    ),
+    component="system",
+    severity=Severity.MEDIUM,
+    timestamp=datetime.min,
+    recommendations=(
+        "Consider scaling horizontally to distribute load",
+        "Review application-level CPU-intensive operations",
+        "Monitor thread pool sizes and async operations",
+    ),
+    metrics=("load_average", "cpu_utilization", "context_switches"),
+    root_cause="AI-powered analysis using Brendan Gregg's USE Method",
+)
+
+# Token budget for a JSON insights answer (2-3 insights); free-text calls
+# such as analyze_bottleneck keep the model default
+INSIGHTS_NUM_PREDICT = 1024
+
+# Invariant parts of the analysis prompt around the metrics summary, so each
+# call only joins three strings instead of re-rendering the whole template
+_ANALYSIS_PROMPT_HEAD = """You are a performance engineer expert in Brendan Gregg's USE Method.
+
+Task: Generate 2-3 performance insights for system analysis.
+
+Context: """
+_ANALYSIS_PROMPT_TAIL = """
+
+CRITICAL: You MUST respond with ONLY a valid JSON object. No explanations, no markdown, just pure JSON.
+
+Schema: {"insights": [{"title": str, "description": str, "component": str, "severity": "CRITICAL"|"HIGH"|"MEDIUM"|"LOW", "recommendations": [str], "metrics": [str], "root_cause": str}]}
+
+Example of expected output:
+{"insights":[{"title":"CPU Saturation Detected","description":"High CPU utilization with load average above threshold indicates saturation.","component":"cpu","severity":"HIGH","recommendations":["Scale horizontally","Optimize hot paths","Review thread pools"],"metrics":["cpu_percent","load_avg"],"root_cause":"Excessive request volume"},{"title":"Memory Pressure","description":"Memory usage approaching limits with swap activity.","component":"memory","severity":"MEDIUM","recommendations":["Increase memory","Add caching","Review memory leaks"],"metrics":["memory_percent","swap_used"],"root_cause":"Growing dataset size"}]}
+
+Now generate insights following this EXACT format. USE Method:
+- Utilization: resource busy time %
+- Saturation: queued work
+- Errors: error events
+
+Respond with the JSON object only:"""
+
 
 class OllamaLLMClient(LLMClientPort):
     """
@@ -26,7 +83,14 @@ class OllamaLLMClient(LLMClientPort):
     Falls back to example insights if Ollama is unavailable.
     """
 
-    def __init__(self, base_url: str, model: str, temperature: float = 0.7, timeout: int = 120):
+    def __init__(
+        self,
+        base_url: str,
+        model: str,
+        temperature: float = 0.7,
+        timeout: int = 120,
+        thresholds: Optional[Dict[str, float]] = None,
+    ):
         """
         Initialize Ollama client.
 
@@ -35,13 +99,23 @@ class OllamaLLMClient(LLMClientPort):
             model: Model name to use
             temperature: Temperature for generation
             timeout: Request timeout in seconds
+            thresholds: Metric levels below which the LLM is not called
+                (missing keys default to DEFAULT_LLM_THRESHOLDS)
         """
         # Remove /v1 suffix if present, we'll add the correct endpoint
         self.base_url = base_url.rstrip("/").replace("/v1", "")
+        self._generate_url = f"{self.base_url}/api/generate"
+        # Pre-serialized request prefixes, keyed by json_mode
+        self._envelopes = {
+            False: generate_envelope(model, temperature),
+            True: generate_envelope(
+                model, temperature, json_mode=True, num_predict=INSIGHTS_NUM_PREDICT
+            ),
+        }
         self.model = model
         self.temperature = temperature
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.thresholds = {**DEFAULT_LLM_THRESHOLDS, **(thresholds or {})}
         logger.info(f"OllamaLLMClient initialized with model={model} at {base_url}")
 
     async def generate_insights(
@@ -54,16 +128,20 @@ class OllamaLLMClient(LLMClientPort):
             metrics: System metrics to analyze (optional)
 
         Returns:
-            List of AI-generated insights
+            List of AI-generated insights (empty if no metric crosses a threshold)
         """
+        if metrics is not None and not self._needs_llm(metrics):
+            logger.info("All metrics below LLM thresholds, skipping LLM analysis")
+            return []
+
         logger.info(f"Generating LLM insights using {self.model} (REAL MODE)")
 
         try:
             # Build prompt based on Brendan Gregg's USE Method
             prompt = self._build_analysis_prompt(metrics)
 
-            # Call Ollama API
-            response_text = await self._call_ollama(prompt)
+            # Call Ollama API in JSON mode
+            response_text = await self._call_ollama(prompt, json_mode=True)
 
             # Parse LLM response into insights
             insights = self._parse_llm_response(response_text)
@@ -76,6 +154,73 @@ class OllamaLLMClient(LLMClientPort):
             # Fallback to example insights if LLM fails
             return self._get_fallback_insights()
 
+    async def generate_insights_batch(
+        self, metrics_list: Sequence[Optional[SystemMetrics]]
+    ) -> List[List[PerformanceInsight]]:
+        """
+        Generate LLM insights for many snapshots in one concurrent wave.
+
+        Snapshots below the LLM thresholds get an empty list, and identical
+        prompts are sent only once with the response parsed per snapshot.
+        Ollama evaluates the concurrent requests together on the loaded model
+        when ``OLLAMA_NUM_PARALLEL`` is at least the batch size.
+
+        Args:
+            metrics_list: Metric snapshots to analyze (None for a generic run)
+
+        Returns:
+            One list of insights per snapshot, in input order
+        """
+        prompts = [
+            None
+            if metrics is not None and not self._needs_llm(metrics)
+            else self._build_analysis_prompt(metrics)
+            for metrics in metrics_list
+        ]
+        unique_prompts = list(dict.fromkeys(p for p in prompts if p is not None))
+
+        logger.info(
+            f"Generating LLM insights for {len(metrics_list)} snapshots "
+            f"with {len(unique_prompts)} Ollama calls"
+        )
+        responses = await asyncio.gather(
+            *(self._call_ollama(p, json_mode=True) for p in unique_prompts),
+            return_exceptions=True,
+        )
+        by_prompt = dict(zip(unique_prompts, responses))
+
+        results = []
+        for prompt in prompts:
+            if prompt is None:
+                results.append([])
+                continue
+            response_text = by_prompt[prompt]
+            if isinstance(response_text, Exception):
+                logger.error(f"Error calling Ollama LLM: {response_text}")
+                results.append(self._get_fallback_insights())
+            else:
+                results.append(self._parse_llm_response(response_text))
+
+        return results
+
+    def _needs_llm(self, metrics: SystemMetrics) -> bool:
+        """Check whether any metric crosses its LLM analysis threshold."""
+        thresholds = self.thresholds
+
+        if metrics.cpu_utilization.value >= thresholds["cpu_utilization"]:
+            return True
+        if metrics.memory_utilization.value >= thresholds["memory_utilization"]:
+            return True
+
+        disk_threshold = thresholds["disk_utilization"]
+        if any(u.value >= disk_threshold for u in metrics.disk_utilization.values()):
+            return True
+
+        return bool(
+            metrics.network_errors
+            and metrics.network_errors.value > thresholds["network_errors"]
+        )
+
     def _build_analysis_prompt(self, metrics: Optional[SystemMetrics]) -> str:
         """Build analysis prompt using Brendan Gregg's methodology."""
 
@@ -85,90 +230,69 @@ class OllamaLLMClient(LLMClientPort):
         else:
             metrics_summary = "Using general system performance patterns"
 
-        prompt = f"""You are a performance engineer expert in Brendan Gregg's USE Method.
-
-Task: Generate 2-3 performance insights for system analysis.
-
-Context: {metrics_summary}
-
-CRITICAL: You MUST respond with ONLY a valid JSON array. No explanations, no markdown, just pure JSON.
-
-Example of expected output:
-[{{"title":"🤖 CPU Saturation Detected","description":"High CPU utilization with load average above threshold indicates saturation.","component":"cpu","severity":"HIGH","recommendations":["Scale horizontally","Optimize hot paths","Review thread pools"],"metrics":["cpu_percent","load_avg"],"root_cause":"Excessive request volume"}},{{"title":"🎯 Memory Pressure","description":"Memory usage approaching limits with swap activity.","component":"memory","severity":"MEDIUM","recommendations":["Increase memory","Add caching","Review memory leaks"],"metrics":["memory_percent","swap_used"],"root_cause":"Growing dataset size"}}]]
-
-Now generate insights following this EXACT format. USE Method:
-- Utilization: resource busy time %
-- Saturation: queued work
-- Errors: error events
-
-Respond with JSON array only:"""
+        return f"{_ANALYSIS_PROMPT_HEAD}{metrics_summary}{_ANALYSIS_PROMPT_TAIL}"
 
-        return prompt
-
-    async def _call_ollama(self, prompt: str) -> str:
-        """Make API call to Ollama."""
-
-        url = f"{self.base_url}/api/generate"
-
-        payload = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": self.temperature,
-            }
-        }
+    async def _call_ollama(self, prompt: str, json_mode: bool = False) -> str:
+        """
+        Make API call to Ollama.
 
-        logger.info(f"Calling Ollama API at {url}")
+        Args:
+            prompt: Prompt to send to the model
+            json_mode: Constrain the output to a single JSON value
+                (Ollama ``format: json``), which keeps generations short and
+                removes the need to scrape JSON out of free-form prose; the
+                response is streamed and closed once the first object or
+                bare array is complete
 
-        try:
-            response = await self.client.post(url, json=payload)
-            response.raise_for_status()
+        Returns:
+            Raw response text from the model
+        """
 
-            data = response.json()
-            response_text = data.get("response", "")
+        logger.info(f"Calling Ollama API at {self._generate_url}")
 
-            logger.info(f"Received response from Ollama ({len(response_text)} chars)")
-            return response_text
+        response_text = await ollama_generate(
+            self._generate_url,
+            self._envelopes[json_mode],
+            prompt,
+            self.timeout,
+            stop_at_json=json_mode,
+        )
 
-        except httpx.HTTPError as e:
-            logger.error(f"HTTP error calling Ollama: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error calling Ollama: {e}")
-            raise
+        logger.info("Received response from Ollama (%d chars)", len(response_text))
+        return response_text
 
     def _parse_llm_response(self, response_text: str) -> List[PerformanceInsight]:
         """Parse LLM JSON response into PerformanceInsight objects."""
 
         try:
             # Log raw response for debugging
-            logger.debug(f"Raw LLM response: {response_text[:500]}...")
-
-            # Extract JSON from response (LLM might add text around it)
-            json_start = response_text.find("[")
-            json_end = response_text.rfind("]") + 1
-
-            if json_start == -1 or json_end == 0:
-                logger.warning(f"No JSON array found in LLM response. Response: {response_text[:200]}")
+            logger.debug("Raw LLM response: %.500s...", response_text)
+
+            insights_data = self._extract_insights_data(response_text)
+            if insights_data is None:
+                logger.warning(
+                    "No JSON insights found in LLM response. Response: %.200s",
+                    response_text,
+                )
                 return self._get_fallback_insights()
 
-            json_str = response_text[json_start:json_end]
-            insights_data = json.loads(json_str)
-
             insights = []
+            # One timestamp for every insight of this response
+            now = datetime.now()
             for data in insights_data:
                 try:
-                    # Map severity string to enum
-                    severity_str = data.get("severity", "MEDIUM").upper()
-                    severity = Severity[severity_str] if severity_str in Severity.__members__ else Severity.MEDIUM
+                    # Map severity string to enum (mixed case is rare)
+                    severity_str = data.get("severity", "MEDIUM")
+                    severity = _SEVERITY_MAP.get(severity_str) or _SEVERITY_MAP.get(
+                        str(severity_str).upper(), Severity.MEDIUM
+                    )
 
                     insight = PerformanceInsight(
-                        title=data.get("title", "🤖 AI Analysis"),
+                        title=data.get("title", "AI Analysis"),
                         description=data.get("description", "Performance analysis completed"),
-                        component=data.get("component", "system"),
+                        component=sys.intern(str(data.get("component", "system"))),
                         severity=severity,
-                        timestamp=datetime.now(),
+                        timestamp=now,
                         recommendations=data.get("recommendations", []),
                         metrics=data.get("metrics", []),
                         root_cause=data.get("root_cause", "AI analysis"),
@@ -192,30 +316,46 @@ Respond with JSON array only:"""
             logger.error(f"Unexpected error parsing LLM response: {e}")
             return self._get_fallback_insights()
 
+    @staticmethod
+    def _extract_insights_data(response_text: str) -> Optional[List[dict]]:
+        """
+        Extract the list of raw insight dicts from an LLM response.
+
+        JSON mode responses are parsed directly as ``{"insights": [...]}``.
+        Anything else (older models, bare arrays, prose around the JSON) falls
+        back to locating the outermost JSON array in the text.
+
+        Args:
+            response_text: Raw response text from the model
+
+        Returns:
+            List of insight dicts, or None if no JSON insights were found
+
+        Raises:
+            json.JSONDecodeError: If the fallback array is not valid JSON
+        """
+        try:
+            data = loads(response_text)
+        except json.JSONDecodeError:
+            data = None
+
+        if isinstance(data, dict) and isinstance(data.get("insights"), list):
+            return data["insights"]
+        if isinstance(data, list):
+            return data
+
+        # Fallback: extract JSON array from response (LLM might add text around it)
+        json_str = extract_top_level_json(response_text, "[")
+        if json_str is None:
+            return None
+
+        return loads(json_str)
+
     def _get_fallback_insights(self) -> List[PerformanceInsight]:
         """Return fallback insights if LLM call fails."""
         logger.info("Using fallback insights")
 
-        return [
-            PerformanceInsight(
-                title="🤖 AI Analysis: System Performance Overview",
-                description=(
-                    "Based on the USE method analysis, I've identified potential "
-                    "bottlenecks in your system. The CPU shows signs of saturation "
-                    "with elevated load averages, which may impact response times."
-                ),
-                component="system",
-                severity=Severity.MEDIUM,
-                timestamp=datetime.now(),
-                recommendations=[
-                    "Consider scaling horizontally to distribute load",
-                    "Review application-level CPU-intensive operations",
-                    "Monitor thread pool sizes and async operations",
-                ],
-                metrics=["load_average", "cpu_utilization", "context_switches"],
-                root_cause="AI-powered analysis using Brendan Gregg's USE Method",
-            ),
-        ]
+        return [replace(_FALLBACK_INSIGHT, timestamp=datetime.now())]
 
     async def analyze_bottleneck(self, insight: PerformanceInsight) -> str:
         """
@@ -241,7 +381,7 @@ Analyze this bottleneck:
 
 Title: {title}
 Component: {insight.component}
-Severity: {insight.severity.value}
+Severity: {insight.severity.name}
 Description: {desc}
 Root Cause: {root_cause}
 
@@ -260,14 +400,14 @@ Keep under 500 words, technical and actionable."""
             logger.error(f"Error analyzing bottleneck with LLM: {e}")
             # Fallback to structured response
             return (
-                f"🤖 AI Analysis for {insight.component}:\n\n"
+                f"AI Analysis for {insight.component}:\n\n"
                 f"Based on the methodology and evidence provided, this appears to be "
-                f"a {insight.severity.value.lower()} priority issue. "
+                f"a {insight.severity.name.lower()} priority issue. "
                 f"The root cause analysis suggests: {insight.root_cause}\n\n"
                 f"Recommended actions:\n"
                 + "\n".join(f"• {rec}" for rec in insight.recommendations)
             )
 
     async def close(self):
-        """Close HTTP client connection."""
-        await self.client.aclose()
+        """Release the client (the shared HTTP pool stays open, see _http)."""
+        logger.info("OllamaLLMClient closed")
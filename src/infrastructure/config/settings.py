@@ -1,7 +1,11 @@
 """Application settings using Pydantic BaseSettings."""
 
+import threading
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -74,50 +78,75 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False,
-        extra="ignore"
+        extra="ignore",
+        # Read once at startup and never changed afterwards
+        frozen=True,
     )
 
-    def __init__(self, **kwargs):
-        """Initialize settings and create necessary directories."""
-        super().__init__(**kwargs)
-
-        # Create directories if they don't exist
+    # Derived values, computed once since the model is frozen
+    _prometheus_base_url: str = PrivateAttr()
+    _ollama_base_url: str = PrivateAttr()
+    _llm_config: Mapping[str, Any] = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        """Compute the derived URLs and LLM configuration."""
+        self._prometheus_base_url = self.prometheus_url.rstrip("/")
+        self._ollama_base_url = self.ollama_url.rstrip("/")
+        self._llm_config = MappingProxyType(
+            {
+                "base_url": self._ollama_base_url,
+                "model": self.ollama_model,
+                "temperature": self.ollama_temperature,
+                "max_tokens": self.ollama_max_tokens,
+                "timeout": self.ollama_timeout,
+            }
+        )
+
+    def ensure_directories(self) -> None:
+        """Create the reports and cache directories if they don't exist."""
         self.reports_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     @property
     def prometheus_base_url(self) -> str:
         """Get Prometheus base URL without trailing slash."""
-        return self.prometheus_url.rstrip("/")
+        return self._prometheus_base_url
 
     @property
     def ollama_base_url(self) -> str:
         """Get Ollama base URL without trailing slash."""
-        return self.ollama_url.rstrip("/")
+        return self._ollama_base_url
 
-    def get_llm_config(self) -> dict:
-        """Get LLM configuration as dictionary."""
-        return {
-            "base_url": self.ollama_base_url,
-            "model": self.ollama_model,
-            "temperature": self.ollama_temperature,
-            "max_tokens": self.ollama_max_tokens,
-            "timeout": self.ollama_timeout,
-        }
+    def get_llm_config(self) -> Mapping[str, Any]:
+        """Get LLM configuration as a read-only mapping (shared, built once)."""
+        return self._llm_config
 
 
 # Global settings instance
 _settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
 
 
 def get_settings() -> Settings:
     """
     Get application settings (singleton pattern).
 
+    The environment and .env file are read once per process, and the
+    configured directories are created on that first call only, so building
+    a Settings() directly (e.g. in tests) does no filesystem I/O. The first
+    construction is locked so concurrent first callers (worker threads) share
+    one instance; later calls only read the global.
+
     Returns:
         Settings instance
     """
     global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    settings = _settings
+    if settings is None:
+        with _settings_lock:
+            if _settings is None:
+                created = Settings()
+                created.ensure_directories()
+                _settings = created
+            settings = _settings
+    return settings
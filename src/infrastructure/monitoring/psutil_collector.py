@@ -1,8 +1,22 @@
 """Psutil-based system metrics collector."""
 
+import asyncio
 import logging
+import socket
+import threading
 import time
-from typing import Dict, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Mapping,
+    Optional,
+    Tuple,
+)
 from datetime import datetime
 
 import psutil
@@ -14,127 +28,372 @@ from application.ports.output.metrics_collector import MetricsCollectorPort
 logger = logging.getLogger(__name__)
 
 
+def _read_proc(path: str, size: int = 65536) -> bytes:
+    """Read a procfs file with one unbuffered read() so the snapshot is consistent.
+
+    The buffer must fit the whole file: /proc/stat grows with one line per CPU
+    and a short buffer would silently cut off the trailing counters.
+    """
+    with open(path, "rb", buffering=0) as f:
+        return f.read(size)
+
+
+def _read_cpu_stat() -> Tuple[Tuple[int, int], Optional[int]]:
+    """
+    Parse CPU time and context switches out of a single /proc/stat read.
+
+    Returns:
+        ((busy, total) aggregate CPU ticks, context switch counter or None)
+    """
+    data = _read_proc("/proc/stat")
+    # First line: "cpu  user nice system idle iowait irq softirq steal guest ..."
+    # guest time is already included in user/nice, so only the first 8 count
+    fields = [int(x) for x in data[4 : data.find(b"\n")].split()[:8]]
+    total = sum(fields)
+    busy = total - fields[3] - fields[4]
+
+    start = data.find(b"\nctxt ")
+    if start == -1:
+        return (busy, total), None
+    start += 6
+    return (busy, total), int(data[start : data.find(b"\n", start)])
+
+
+def _cpu_ticks_from_psutil() -> Tuple[float, float]:
+    """Aggregate (busy, total) CPU time from psutil.cpu_times() (portable)."""
+    times = psutil.cpu_times()
+    total = (
+        sum(times)
+        - getattr(times, "guest", 0.0)
+        - getattr(times, "guest_nice", 0.0)
+    )
+    idle = times.idle + getattr(times, "iowait", 0.0)
+    return total - idle, total
+
+
+# The host name does not change while the process runs; resolve it once
+_HOSTNAME = socket.gethostname() or "localhost"
+
+# Shared placeholder for NICs (MetricValue is immutable, so one instance serves
+# every interface and sample)
+_ZERO_PCT = MetricValue(0, "%")
+
+# Shared read-only results for a failed component collection (the error itself
+# is logged); the "error" key keeps them out of the component cache
+_SCALAR_ERROR_RESULT: Mapping[str, Any] = MappingProxyType(
+    {"utilization": 0, "error": "collection failed"}
+)
+_MAPPING_ERROR_RESULT: Mapping[str, Any] = MappingProxyType(
+    {
+        "utilization": MappingProxyType({}),
+        "io_stats": None,
+        "error": "collection failed",
+    }
+)
+
+# Below this many seconds a CPU time delta is too short to be meaningful
+MIN_CPU_SAMPLE_INTERVAL = 0.1
+
+# Pseudo/virtual filesystems whose usage says nothing about real storage
+IGNORED_FSTYPES = frozenset(
+    {
+        "tmpfs",
+        "devtmpfs",
+        "overlay",
+        "squashfs",
+        "proc",
+        "sysfs",
+        "cgroup",
+        "cgroup2",
+        "autofs",
+        "devpts",
+        "debugfs",
+        "tracefs",
+        "securityfs",
+        "pstore",
+        "mqueue",
+        "hugetlbfs",
+        "fusectl",
+        "configfs",
+        "binfmt_misc",
+        "nsfs",
+        "ramfs",
+    }
+)
+
+
 class PsutilCollector(MetricsCollectorPort):
     """Infrastructure adapter for collecting system metrics using psutil."""
 
-    def __init__(self, cache_duration: float = 1.0):
+    def __init__(
+        self,
+        cache_duration: float = 1.0,
+        disk_timeout: float = 2.0,
+        partitions_ttl: float = 30.0,
+        ignored_fstypes: Optional[Iterable[str]] = None,
+        component_ttls: Optional[Dict[str, float]] = None,
+        background: bool = False,
+    ):
         """
         Initialize the metrics collector.
 
         Args:
-            cache_duration: Cache duration in seconds to avoid excessive calls
+            cache_duration: Cache duration in seconds for CPU and memory metrics
+            disk_timeout: Seconds to wait for per-partition disk usage before
+                skipping slow mounts (e.g. hung NFS)
+            partitions_ttl: Seconds to reuse the filtered partition list
+            ignored_fstypes: Filesystem types to skip (defaults to IGNORED_FSTYPES)
+            component_ttls: Per-component cache durations overriding the
+                defaults ("cpu", "memory", "disk", "network")
+            background: Sample in a daemon thread every cache_duration seconds
+                so collect() only returns the latest snapshot instead of
+                querying psutil on the caller's path
         """
         self.cache_duration = cache_duration
-        self._cache: Dict[str, Any] = {}
-        self._last_update: float = 0
+        self.disk_timeout = disk_timeout
+        self.partitions_ttl = partitions_ttl
+        self._ignored_fstypes: FrozenSet[str] = (
+            frozenset(ignored_fstypes)
+            if ignored_fstypes is not None
+            else IGNORED_FSTYPES
+        )
+        self._partitions: Tuple[Tuple[str, str], ...] = ()
+        self._partitions_ts: float = 0
+        self._ttl: Dict[str, float] = {
+            "cpu": cache_duration,
+            "memory": cache_duration,
+            "disk": max(cache_duration, 5.0),
+            "network": max(cache_duration, 5.0),
+        }
+        self._ttl.update(component_ttls or {})
+        self._cache: Dict[str, Mapping[str, Any]] = {}
+        self._cache_ts: Dict[str, float] = {}
+        # Time of the latest psutil read and the snapshot built from it
+        self._sampled_at: float = 0.0
+        self._last_sample: Optional[SystemMetrics] = None
+        self._sample_lock = threading.Lock()
+
+        # Core counts never change at runtime
+        self._cpu_count_logical = psutil.cpu_count(logical=True)
+        self._cpu_count_physical = (
+            psutil.cpu_count(logical=False) or self._cpu_count_logical
+        )
+        # Saturation is the 1-minute load per logical CPU, as a percentage
+        self._cpu_sat_scale = (
+            100.0 / self._cpu_count_logical if self._cpu_count_logical else 0.0
+        )
+
+        # CPU utilization is the busy share of the CPU time elapsed since the
+        # previous collection (never a blocking sleep); prime the counters
+        self._prev_cpu_ticks, _ = self._read_cpu_counters()
+        self._cpu_primed_at: Optional[float] = time.monotonic()
+
+        # statvfs() releases the GIL, so partitions are queried concurrently
+        self._disk_pool = ThreadPoolExecutor(
+            max_workers=8, thread_name_prefix="disk-usage"
+        )
+        # Timed-out disk_usage calls still running, by mountpoint; a hung
+        # mount is not queried again until its call returns
+        self._disk_inflight: Dict[str, Future] = {}
+
+        self._latest: Optional[SystemMetrics] = None
+        self._stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
+        if background:
+            self._start_sampler()
 
     async def collect(self) -> SystemMetrics:
         """
         Collect all system metrics.
 
+        Each component is refreshed on its own TTL, so expensive ones (disk,
+        network) are not recomputed at the CPU cadence. With the background
+        sampler running this is a plain read of the latest snapshot; otherwise
+        a refresh runs in a worker thread so the blocking psutil and procfs
+        calls never stall the event loop.
+
         Returns:
             SystemMetrics entity with current system state
-        """
-        current_time = time.time()
 
-        # Use cache if still valid
-        if current_time - self._last_update < self.cache_duration and self._cache:
-            logger.debug("Using cached metrics")
-            return self._build_metrics_from_cache()
+        Raises:
+            RuntimeError: If the collector was closed
+        """
+        self._check_open()
+        latest = self._latest
+        if latest is not None:
+            return latest
 
-        logger.info("Collecting system metrics")
+        last = self._last_sample
+        if last is not None and not self._needs_refresh(time.time()):
+            return last
 
         try:
-            # Collect all metrics
-            cpu_metrics = self._collect_cpu_metrics()
-            memory_metrics = self._collect_memory_metrics()
-            disk_metrics = self._collect_disk_metrics()
-            network_metrics = self._collect_network_metrics()
-
-            # Build SystemMetrics entity
-            metrics = SystemMetrics(
-                timestamp=datetime.now(),
-                hostname="localhost",
-                cpu_utilization=MetricValue(cpu_metrics["utilization"], "%"),
-                memory_utilization=MetricValue(memory_metrics["utilization"], "%"),
-                cpu_load_average=cpu_metrics.get("load_average"),
-                memory_available=MetricValue(memory_metrics["available"], "GB")
-                if memory_metrics.get("available")
-                else None,
-                disk_utilization=disk_metrics["utilization"],
-                network_utilization=network_metrics["utilization"],
-            )
-
-            # Update cache
-            self._cache = {
-                "cpu": cpu_metrics,
-                "memory": memory_metrics,
-                "disk": disk_metrics,
-                "network": network_metrics,
-                "hostname": metrics.hostname,
-            }
-            self._last_update = current_time
-
-            return metrics
+            return await asyncio.to_thread(self._sample)
 
         except Exception as e:
             logger.error(f"Failed to collect metrics: {e}")
             raise
 
-    def _build_metrics_from_cache(self) -> SystemMetrics:
-        """Build SystemMetrics from cached data."""
-        cache = self._cache
+    def _sample(self) -> SystemMetrics:
+        """
+        Collect every component (honouring its TTL) into one snapshot.
+
+        When every component is still cached the previous snapshot is
+        returned as is, so its timestamp keeps telling when the data was
+        actually read rather than when it was asked for.
+        """
+        # Callers may sample from several threads at once
+        with self._sample_lock:
+            self._check_open()
+            # One clock read per cycle drives the TTL checks and the timestamp
+            now = time.time()
+            sampled_at = self._sampled_at
+            cpu = self._get_component("cpu", self._collect_cpu_metrics, now)
+            memory = self._get_component("memory", self._collect_memory_metrics, now)
+            disk = self._get_component("disk", self._collect_disk_metrics, now)
+            network = self._get_component(
+                "network", self._collect_network_metrics, now
+            )
+
+            if self._sampled_at == sampled_at and self._last_sample is not None:
+                return self._last_sample
+
+            self._last_sample = self._build_metrics(now, cpu, memory, disk, network)
+            return self._last_sample
+
+    def _check_open(self) -> None:
+        """Fail clearly instead of submitting to the shut-down disk pool."""
+        if self._stop.is_set():
+            raise RuntimeError("PsutilCollector is closed")
+
+    def _needs_refresh(self, now: float) -> bool:
+        """Check whether any component is missing or past its TTL."""
+        cache_ts = self._cache_ts
+        return any(
+            key not in cache_ts or now - cache_ts[key] >= ttl
+            for key, ttl in self._ttl.items()
+        )
+
+    def _start_sampler(self) -> None:
+        """Take a first snapshot and keep refreshing it in a daemon thread."""
+        self._latest = self._sample()
+        self._sampler = threading.Thread(
+            target=self._sample_loop, name="metrics-sampler", daemon=True
+        )
+        self._sampler.start()
+
+    def _sample_loop(self) -> None:
+        """Refresh the latest snapshot every cache_duration until closed."""
+        while not self._stop.wait(self.cache_duration):
+            try:
+                # A single reference swap publishes the new snapshot
+                self._latest = self._sample()
+            except Exception as e:
+                logger.error(f"Background metrics sampling failed: {e}")
+
+    def _get_component(
+        self, key: str, collector: Callable[[], Mapping[str, Any]], now: float
+    ) -> Mapping[str, Any]:
+        """Return cached component metrics, re-collecting once its TTL expires."""
+        cached = self._cache.get(key)
+        if cached is not None and now - self._cache_ts[key] < self._ttl[key]:
+            return cached
+
+        logger.debug(f"Collecting {key} metrics")
+        result = collector()
+        self._sampled_at = now
+        # Failed collections are retried on the next call instead of cached
+        if "error" not in result:
+            self._cache[key] = result
+            self._cache_ts[key] = now
+        return result
+
+    def _build_metrics(
+        self,
+        now: float,
+        cpu: Mapping[str, Any],
+        memory: Mapping[str, Any],
+        disk: Mapping[str, Any],
+        network: Mapping[str, Any],
+    ) -> SystemMetrics:
+        """Build SystemMetrics from per-component results."""
         return SystemMetrics(
-            timestamp=datetime.now(),
-            hostname=cache["hostname"],
-            cpu_utilization=MetricValue(cache["cpu"]["utilization"], "%"),
-            memory_utilization=MetricValue(cache["memory"]["utilization"], "%"),
-            cpu_load_average=cache["cpu"].get("load_average"),
-            memory_available=MetricValue(cache["memory"]["available"], "GB")
-            if cache["memory"].get("available")
+            timestamp=datetime.fromtimestamp(now),
+            hostname=_HOSTNAME,
+            cpu_utilization=MetricValue(cpu["utilization"], "%"),
+            memory_utilization=MetricValue(memory["utilization"], "%"),
+            cpu_load_average=cpu.get("load_average"),
+            memory_available=MetricValue(memory["available"], "GB")
+            if memory.get("available")
             else None,
-            disk_utilization=cache["disk"]["utilization"],
-            network_utilization=cache["network"]["utilization"],
+            disk_utilization=disk["utilization"],
+            network_utilization=network["utilization"],
         )
 
-    def _collect_cpu_metrics(self) -> Dict[str, Any]:
+    def _collect_cpu_metrics(self) -> Mapping[str, Any]:
         """Collect CPU-related metrics."""
         try:
-            # CPU utilization
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            # CPU time and context switches from one /proc/stat read
+            (busy, total), context_switches = self._read_cpu_counters()
+            prev_busy, prev_total = self._prev_cpu_ticks
+            self._prev_cpu_ticks = (busy, total)
+
+            # CPU utilization since the previous call (non-blocking)
+            if self._cpu_primed_at is not None and (
+                time.monotonic() - self._cpu_primed_at < MIN_CPU_SAMPLE_INTERVAL
+            ):
+                # A delta over a few milliseconds is noise; use the
+                # since-boot average for a collection right after startup
+                prev_busy = prev_total = 0
+            self._cpu_primed_at = None
+            elapsed = total - prev_total
+            cpu_percent = (
+                min(max((busy - prev_busy) / elapsed * 100, 0.0), 100.0)
+                if elapsed > 0
+                else 0.0
+            )
 
             # Load average (Linux/Unix only)
             load_avg = None
             try:
-                load_avg = {
-                    "1min": psutil.getloadavg()[0],
-                    "5min": psutil.getloadavg()[1],
-                    "15min": psutil.getloadavg()[2],
-                }
+                load_1, load_5, load_15 = psutil.getloadavg()
+                load_avg = {"1min": load_1, "5min": load_5, "15min": load_15}
             except (AttributeError, OSError):
                 # Windows doesn't have load average
                 pass
 
-            # CPU context switches
-            context_switches = None
-            try:
-                context_switches = psutil.cpu_stats().ctx_switches
-            except (AttributeError, OSError):
-                pass
+            if context_switches is None:
+                # Non-Linux, or ctxt beyond the first read of /proc/stat
+                try:
+                    context_switches = psutil.cpu_stats().ctx_switches
+                except (AttributeError, OSError):
+                    pass
 
             return {
                 "utilization": round(cpu_percent, 1),
+                "saturation": round(load_avg["1min"] * self._cpu_sat_scale, 1)
+                if load_avg
+                else None,
                 "load_average": load_avg,
                 "context_switches": context_switches,
-                "cores": psutil.cpu_count(),
-                "cores_logical": psutil.cpu_count(logical=True),
+                "cores": self._cpu_count_physical,
+                "cores_logical": self._cpu_count_logical,
             }
 
         except Exception as e:
             logger.error(f"Failed to collect CPU metrics: {e}")
-            return {"utilization": 0, "error": str(e)}
+            return _SCALAR_ERROR_RESULT
+
+    @staticmethod
+    def _read_cpu_counters() -> Tuple[Tuple[float, float], Optional[int]]:
+        """(busy, total) CPU time plus context switches, /proc/stat first."""
+        try:
+            return _read_cpu_stat()
+        except (OSError, ValueError, IndexError):
+            # Non-Linux: context switches come from psutil.cpu_stats()
+            return _cpu_ticks_from_psutil(), None
 
-    def _collect_memory_metrics(self) -> Dict[str, Any]:
+    def _collect_memory_metrics(self) -> Mapping[str, Any]:
         """Collect memory-related metrics."""
         try:
             virtual = psutil.virtual_memory()
@@ -151,24 +410,75 @@ class PsutilCollector(MetricsCollectorPort):
 
         except Exception as e:
             logger.error(f"Failed to collect memory metrics: {e}")
-            return {"utilization": 0, "error": str(e)}
+            return _SCALAR_ERROR_RESULT
 
-    def _collect_disk_metrics(self) -> Dict[str, Any]:
+    def _get_partitions(self) -> Tuple[Tuple[str, str], ...]:
+        """
+        Return (device, mountpoint) of real partitions.
+
+        The mount table is re-read every partitions_ttl seconds, or on the
+        next call after a mountpoint failed to answer.
+        """
+        now = time.time()
+        if now - self._partitions_ts >= self.partitions_ttl:
+            self._partitions = tuple(
+                (p.device, p.mountpoint)
+                for p in psutil.disk_partitions(all=False)
+                if p.fstype not in self._ignored_fstypes
+            )
+            self._partitions_ts = now
+        return self._partitions
+
+    def _collect_disk_metrics(self) -> Mapping[str, Any]:
         """Collect disk-related metrics."""
         try:
             disk_utilization = {}
             disk_io = None
 
-            # Disk utilization per partition
-            for partition in psutil.disk_partitions():
+            # Forget hung calls that have returned in the meantime
+            inflight = self._disk_inflight
+            for mountpoint in [m for m, f in inflight.items() if f.done()]:
+                del inflight[mountpoint]
+
+            # Disk utilization per partition, queried in parallel
+            futures = [
+                (
+                    device,
+                    mountpoint,
+                    self._disk_pool.submit(psutil.disk_usage, mountpoint),
+                )
+                for device, mountpoint in self._get_partitions()
+                if mountpoint not in inflight
+            ]
+            done, pending = wait(
+                [f for _, _, f in futures], timeout=self.disk_timeout
+            )
+            if pending:
+                logger.warning(
+                    "Disk usage timed out for %d partition(s)", len(pending)
+                )
+            if inflight:
+                logger.debug(
+                    "Skipping %d partition(s) with a hung disk usage call",
+                    len(inflight),
+                )
+
+            for device, mountpoint, future in futures:
+                if future not in done:
+                    inflight[mountpoint] = future
+                    continue
                 try:
-                    usage = psutil.disk_usage(partition.mountpoint)
-                    disk_utilization[partition.device] = MetricValue(
+                    usage = future.result()
+                    disk_utilization[device] = MetricValue(
                         round((usage.used / usage.total) * 100, 1), "%"
                     )
-                except (PermissionError, OSError):
+                except PermissionError:
                     # Skip inaccessible partitions
                     continue
+                except OSError:
+                    # Likely unmounted since the table was read; refresh it
+                    self._partitions_ts = 0
+                    continue
 
             # Disk I/O stats
             try:
@@ -190,9 +500,9 @@ class PsutilCollector(MetricsCollectorPort):
 
         except Exception as e:
             logger.error(f"Failed to collect disk metrics: {e}")
-            return {"utilization": {}, "error": str(e)}
+            return _MAPPING_ERROR_RESULT
 
-    def _collect_network_metrics(self) -> Dict[str, Any]:
+    def _collect_network_metrics(self) -> Mapping[str, Any]:
         """Collect network-related metrics."""
         try:
             network_utilization = {}
@@ -205,8 +515,12 @@ class PsutilCollector(MetricsCollectorPort):
                 network_drops = 0
 
                 for interface, stats in net_io.items():
+                    # Loopback traffic never leaves the host
+                    if interface.startswith("lo"):
+                        continue
+
                     # Calculate utilization (simplified - would need baseline for real utilization)
-                    network_utilization[interface] = MetricValue(0, "%")  # Placeholder
+                    network_utilization[interface] = _ZERO_PCT  # Placeholder
 
                     network_errors += stats.errin + stats.errout
                     network_drops += stats.dropin + stats.dropout
@@ -226,4 +540,17 @@ class PsutilCollector(MetricsCollectorPort):
 
         except Exception as e:
             logger.error(f"Failed to collect network metrics: {e}")
-            return {"utilization": {}, "error": str(e)}
+            return _MAPPING_ERROR_RESULT
+
+    def close(self) -> None:
+        """
+        Stop the background sampler and release the disk usage threads.
+
+        The collector cannot be used afterwards: collect() raises RuntimeError.
+        """
+        self._stop.set()
+        if self._sampler is not None:
+            self._sampler.join(timeout=self.disk_timeout + self.cache_duration)
+            self._sampler = None
+        self._latest = None
+        self._disk_pool.shutdown(wait=False)
@@ -1,9 +1,15 @@
 """File-based implementation of InsightsRepository."""
 
 import logging
+import os
+import re
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.domain.performance.entities.performance_insight import PerformanceInsight
 from src.domain.performance.repositories.insights_repository import InsightsRepository
@@ -11,6 +17,63 @@ from src.domain.performance.value_objects.severity import Severity
 
 logger = logging.getLogger(__name__)
 
+# Parsed files kept in memory, keyed by (path, mtime_ns)
+PARSE_CACHE_SIZE = 8
+
+_INSIGHTS_MARKER = "💡 INSIGHTS GENERATED:"
+
+# Severity names as they may be spelled in a report (upper- or lower-case)
+_SEVERITY_MAP = {
+    **{member.name: member for member in Severity},
+    **{member.name.lower(): member for member in Severity},
+}
+
+# A line of more than 50 "=" (or anything starting with "=" that long) closes
+# the insights section
+_SEPARATOR_RE = re.compile(r"=.{50,}")
+
+# Matches one meaningful line of the insights section: an insight header
+# ("  [LEVEL] Title"), a "Key: value" field, or free description text (a
+# repeated marker line is skipped). Every alternative has exactly one group,
+# so match.lastgroup names the kind of line; fields are tried in priority
+# order when a line mentions several.
+_LINE_RE = re.compile(
+    rf"^(?!.*{re.escape(_INSIGHTS_MARKER)})(?:"
+    r"  \[.*?\] (?P<title>.*)"
+    r"|.*?Component:(?P<component>.*)"
+    r"|.*?Severity:(?P<severity>.*)"
+    r"|.*?Methodology:(?P<methodology>.*)"
+    r"|.*?Evidence:(?P<evidence>.*)"
+    r"|(?!=)(?P<text>.*\S.*)"
+    r")$"
+)
+
+
+@dataclass(slots=True)
+class _InsightIndex:
+    """Query-ready view of one parsed file, built once per file change."""
+
+    # Newest first, as get_all() returns them
+    insights: List[PerformanceInsight]
+    by_severity: Dict[Severity, List[PerformanceInsight]]
+    # Aligned with insights
+    components_lower: Tuple[str, ...]
+
+    @classmethod
+    def build(cls, insights: List[PerformanceInsight]) -> "_InsightIndex":
+        """Sort the insights and group them by severity."""
+        ordered = sorted(insights, key=lambda x: x.timestamp, reverse=True)
+        by_severity: Dict[Severity, List[PerformanceInsight]] = {
+            severity: [] for severity in Severity
+        }
+        for insight in ordered:
+            by_severity[insight.severity].append(insight)
+        return cls(
+            insights=ordered,
+            by_severity=by_severity,
+            components_lower=tuple(i.component.lower() for i in ordered),
+        )
+
 
 class FileInsightsRepository(InsightsRepository):
     """File-based repository for performance insights.
@@ -27,9 +90,10 @@ class FileInsightsRepository(InsightsRepository):
             reports_dir: Directory containing validation report files
         """
         self.reports_dir = Path(reports_dir)
-        self._cache: Optional[List[PerformanceInsight]] = None
-        self._cache_time: Optional[datetime] = None
-        self._cache_ttl_seconds = 30  # Cache for 30 seconds
+        # An unchanged file is never parsed twice; a rewrite changes its mtime
+        self._parse_cache: "OrderedDict[Tuple[str, int], _InsightIndex]" = (
+            OrderedDict()
+        )
 
     def _parse_validation_file(self, file_path: Path) -> List[PerformanceInsight]:
         """
@@ -44,72 +108,53 @@ class FileInsightsRepository(InsightsRepository):
         insights = []
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Look for the insights section
-            if "💡 INSIGHTS GENERATED:" not in content:
-                logger.debug(f"No insights section found in {file_path}")
-                return []
-
-            lines = content.split("\n")
-            in_insights_section = False
             current_data = {}
-
-            for line in lines:
-                if "💡 INSIGHTS GENERATED:" in line:
-                    in_insights_section = True
-                    continue
-
-                if not in_insights_section:
-                    continue
-
-                # Stop at section separator
-                if line.startswith("=") and len(line) > 50:
-                    if current_data:
-                        insight = self._create_insight_from_data(current_data)
-                        if insight:
-                            insights.append(insight)
-                    break
-
-                # Start of new insight
-                if line.startswith("  [") and "] " in line:
-                    # Save previous insight
-                    if current_data:
-                        insight = self._create_insight_from_data(current_data)
-                        if insight:
-                            insights.append(insight)
-
-                    # Start new insight
-                    current_data = {}
-                    title_part = line.split("] ", 1)[1] if "] " in line else ""
-                    current_data["title"] = title_part.strip()
-
-                elif "Component:" in line:
-                    current_data["component"] = line.split("Component:", 1)[1].strip()
-
-                elif "Severity:" in line:
-                    severity_str = line.split("Severity:", 1)[1].strip().upper()
-                    current_data["severity"] = severity_str
-
-                elif "Methodology:" in line:
-                    current_data["methodology"] = line.split("Methodology:", 1)[1].strip()
-
-                elif "Evidence:" in line:
-                    evidence_str = line.split("Evidence:", 1)[1].strip()
-                    # Parse key=value pairs
-                    evidence = []
-                    for pair in evidence_str.split(", "):
-                        if "=" in pair:
-                            evidence.append(pair)
-                    current_data["evidence"] = evidence
-
-                elif line.strip() and not line.startswith("="):
-                    # Additional description
-                    if "description" not in current_data:
-                        current_data["description"] = line.strip()
+            # Stream the file: skip to the marker, then stop reading at the
+            # separator that closes the section
+            with open(file_path, "r", encoding="utf-8", buffering=1 << 16) as f:
+                for line in f:
+                    if _INSIGHTS_MARKER in line:
+                        break
+                else:
+                    logger.debug(f"No insights section found in {file_path}")
+                    return []
+
+                for line in f:
+                    line = line.rstrip("\n")
+                    if _SEPARATOR_RE.match(line):
+                        break
+                    match = _LINE_RE.match(line)
+                    if match is None:
+                        continue
+
+                    kind = match.lastgroup
+                    value = match.group(kind).strip()
+
+                    if kind == "title":
+                        # Start of new insight; save the previous one
+                        if current_data:
+                            insight = self._create_insight_from_data(current_data)
+                            if insight:
+                                insights.append(insight)
+                        current_data = {"title": value}
+
+                    elif kind == "severity":
+                        current_data["severity"] = value.upper()
+
+                    elif kind == "evidence":
+                        # Keep the key=value pairs
+                        current_data["evidence"] = [
+                            pair for pair in value.split(", ") if "=" in pair
+                        ]
+
+                    elif kind != "text":
+                        current_data[kind] = value
+
+                    elif "description" not in current_data:
+                        # Additional description
+                        current_data["description"] = value
                     else:
-                        current_data["description"] += " " + line.strip()
+                        current_data["description"] += " " + value
 
             # Add last insight if exists
             if current_data:
@@ -141,11 +186,14 @@ class FileInsightsRepository(InsightsRepository):
                 return None
 
             # Parse severity
-            severity_str = data.get("severity", "MEDIUM").upper()
-            try:
-                severity = Severity[severity_str]
-            except KeyError:
-                logger.warning(f"Unknown severity '{severity_str}', defaulting to MEDIUM")
+            severity_str = data.get("severity", "MEDIUM")
+            severity = _SEVERITY_MAP.get(severity_str) or _SEVERITY_MAP.get(
+                severity_str.upper()
+            )
+            if severity is None:
+                logger.warning(
+                    f"Unknown severity '{severity_str.upper()}', defaulting to MEDIUM"
+                )
                 severity = Severity.MEDIUM
 
             # Build description
@@ -164,7 +212,7 @@ class FileInsightsRepository(InsightsRepository):
             insight = PerformanceInsight(
                 title=title,
                 description=description,
-                component=data.get("component", "System"),
+                component=sys.intern(str(data.get("component", "System"))),
                 severity=severity,
                 timestamp=datetime.now(),
                 recommendations=recommendations,
@@ -178,91 +226,98 @@ class FileInsightsRepository(InsightsRepository):
             logger.error(f"Error creating insight from data: {e}")
             return None
 
-    def _load_all_insights(self) -> List[PerformanceInsight]:
+    def _find_latest_file(self) -> Optional[Tuple[Path, int]]:
         """
-        Load all insights from validation files.
+        Find the most recent validation file in one directory pass.
 
         Returns:
-            List of all insights from the most recent file
+            Path and st_mtime_ns of the newest validation_*.txt, or None if
+            there is none
         """
-        # Find the most recent validation file
-        validation_files = sorted(
-            self.reports_dir.glob("validation_*.txt"),
-            key=lambda p: p.stat().st_mtime,
-            reverse=True,
-        )
-
-        if not validation_files:
+        best: Optional[os.DirEntry] = None
+        best_mtime = -1
+        try:
+            with os.scandir(self.reports_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith("validation_") and name.endswith(".txt")):
+                        continue
+                    try:
+                        mtime = entry.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    if mtime > best_mtime:
+                        best, best_mtime = entry, mtime
+        except OSError:
+            best = None
+
+        if best is None:
             logger.warning(f"No validation files found in {self.reports_dir}")
-            return []
-
-        latest_file = validation_files[0]
-        logger.info(f"Loading insights from {latest_file.name}")
+            return None
 
-        insights = self._parse_validation_file(latest_file)
-        return insights
+        return Path(best.path), best_mtime
 
-    def _get_cached_insights(self) -> List[PerformanceInsight]:
+    def _get_cached_insights(self) -> _InsightIndex:
         """
-        Get insights from cache or load from file.
+        Get insights of the most recent file, parsing it only if it changed.
 
         Returns:
-            List of cached or freshly loaded insights
+            Index of the cached or freshly loaded insights
         """
-        now = datetime.now()
-
-        # Check cache validity
-        if (
-            self._cache is not None
-            and self._cache_time is not None
-            and (now - self._cache_time).total_seconds() < self._cache_ttl_seconds
-        ):
+        latest = self._find_latest_file()
+        if latest is None:
+            return _InsightIndex.build([])
+
+        latest_file, mtime_ns = latest
+        key = (str(latest_file), mtime_ns)
+
+        cache = self._parse_cache
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
             logger.debug("Returning cached insights")
-            return self._cache
+            return cached
 
-        # Load fresh data
-        logger.debug("Cache expired or empty, loading from file")
-        self._cache = self._load_all_insights()
-        self._cache_time = now
+        logger.info(f"Loading insights from {latest_file.name}")
+        index = _InsightIndex.build(self._parse_validation_file(latest_file))
+        cache[key] = index
+        if len(cache) > PARSE_CACHE_SIZE:
+            cache.popitem(last=False)
 
-        return self._cache
+        return index
 
     # Implement abstract methods
 
     async def get_all(self, limit: Optional[int] = None) -> List[PerformanceInsight]:
         """Get all insights, optionally limited."""
-        insights = self._get_cached_insights()
-
-        # Sort by timestamp (newest first)
-        insights.sort(key=lambda x: x.timestamp, reverse=True)
-
-        if limit:
-            return insights[:limit]
-        return insights
+        # Already sorted newest first; slicing hands out a copy
+        insights = self._get_cached_insights().insights
+        return insights[:limit] if limit else insights[:]
 
     async def get_by_severity(
         self, severity: Severity, limit: Optional[int] = None
     ) -> List[PerformanceInsight]:
         """Get insights filtered by severity."""
-        all_insights = await self.get_all()
-        filtered = [i for i in all_insights if i.severity == severity]
-
-        if limit:
-            return filtered[:limit]
-        return filtered
+        filtered = self._get_cached_insights().by_severity[severity]
+        return filtered[:limit] if limit else filtered[:]
 
     async def get_by_component(
         self, component: str, limit: Optional[int] = None
     ) -> List[PerformanceInsight]:
         """Get insights for a specific component."""
-        all_insights = await self.get_all()
+        index = self._get_cached_insights()
         # Case-insensitive comparison
         component_lower = component.lower()
-        filtered = [i for i in all_insights if component_lower in i.component.lower()]
+        matches = (
+            insight
+            for insight, name in zip(index.insights, index.components_lower)
+            if component_lower in name
+        )
 
+        # Stop scanning once enough matches are found
         if limit:
-            return filtered[:limit]
-        return filtered
+            return list(islice(matches, limit))
+        return list(matches)
 
     async def get_critical_insights(self) -> List[PerformanceInsight]:
         """Get only critical insights."""
@@ -272,23 +327,17 @@ class FileInsightsRepository(InsightsRepository):
         self, start_time: datetime, end_time: datetime
     ) -> List[PerformanceInsight]:
         """Get insights within a time range."""
-        all_insights = await self.get_all()
         filtered = [
             i
-            for i in all_insights
+            for i in self._get_cached_insights().insights
             if start_time <= i.timestamp <= end_time
         ]
         return filtered
 
     async def count_by_severity(self) -> dict[Severity, int]:
         """Count insights grouped by severity."""
-        all_insights = await self.get_all()
-        counts = {severity: 0 for severity in Severity}
-
-        for insight in all_insights:
-            counts[insight.severity] += 1
-
-        return counts
+        by_severity = self._get_cached_insights().by_severity
+        return {severity: len(insights) for severity, insights in by_severity.items()}
 
     async def save(self, insight: PerformanceInsight) -> None:
         """Save a performance insight (not implemented for file-based)."""
@@ -1,7 +1,7 @@
 """Dashboard routes for Grafana integration."""
 
 from pathlib import Path
-from fastapi import APIRouter, Request
+from fastapi import APIRouter
 from fastapi.responses import HTMLResponse
 from fastapi.templating import Jinja2Templates
 
@@ -12,30 +12,29 @@ router = APIRouter()
 templates_dir = Path(__file__).parent.parent / "templates"
 templates = Jinja2Templates(directory=str(templates_dir))
 
+# The dashboards use no per-request context (data is fetched client-side),
+# so each page is rendered once at import and served as-is
+_DASHBOARD_HTML = templates.get_template("dashboard.html").render().encode()
+_LLM_DASHBOARD_HTML = templates.get_template("llm_dashboard.html").render().encode()
+
 
 @router.get("/dashboard", response_class=HTMLResponse)
-async def dashboard_page(request: Request):
+async def dashboard_page():
     """
     Serve dashboard HTML page for embedding in Grafana.
 
     This dashboard shows the latest performance insights with stats cards
     and a table of recent analysis results.
     """
-    return templates.TemplateResponse(
-        "dashboard.html",
-        {"request": request}
-    )
+    return HTMLResponse(content=_DASHBOARD_HTML)
 
 
 @router.get("/dashboard/llm", response_class=HTMLResponse)
-async def llm_dashboard(request: Request):
+async def llm_dashboard():
     """
     Serve LLM-powered insights dashboard for Grafana.
 
     This dashboard shows AI-generated performance insights using the
     MiniMax-M2 language model via Ollama. Analysis may take 30-60 seconds.
     """
-    return templates.TemplateResponse(
-        "llm_dashboard.html",
-        {"request": request}
-    )
+    return HTMLResponse(content=_LLM_DASHBOARD_HTML)
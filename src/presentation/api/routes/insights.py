@@ -1,9 +1,10 @@
 """Clean API routes for performance insights (DDD architecture)."""
 
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query
 
 from src.application.use_cases.performance import (
     GetAllInsightsUseCase,
@@ -16,6 +17,7 @@ from src.application.use_cases.performance import (
 from src.domain.performance.entities.performance_insight import PerformanceInsight
 from src.domain.performance.repositories.insights_repository import InsightsRepository
 from src.presentation.api.schemas import (
+    COMPONENT_EMOJI,
     InsightsListResponse,
     InsightResponse,
     LatestInsightResponse,
@@ -31,42 +33,74 @@ router = APIRouter(prefix="/api/insights", tags=["insights"])
 # Repository instance injected by brendan_api_server during setup
 _repository_instance: Optional[InsightsRepository] = None
 
+# Response timestamp of the current wall-clock second: (second, ISO string)
+_now_iso_cache: Tuple[int, str] = (0, "")
+
+
+async def _now_iso() -> str:
+    """
+    Dependency providing the response timestamp.
+
+    Dashboards poll these endpoints many times per second, so the ISO string
+    is formatted at most once per wall-clock second and shared.
+
+    Returns:
+        Current local time in ISO format
+    """
+    global _now_iso_cache
+    second = int(time.time())
+    cached_second, value = _now_iso_cache
+    if second != cached_second:
+        value = datetime.now().isoformat()
+        _now_iso_cache = (second, value)
+    return value
+
 
 def _insight_to_response(insight: PerformanceInsight) -> InsightResponse:
     """
     Convert domain entity to API response schema.
 
+    Built with model_construct(): every field comes from a domain entity with
+    known types, so per-field validation would only repeat work.
+
     Args:
         insight: Performance insight entity
 
     Returns:
         Insight response schema
     """
-    return InsightResponse(
+    recommendations = list(insight.recommendations)
+    metrics = list(insight.metrics)
+    description = insight.description
+    root_cause = insight.root_cause
+    component = insight.component
+    return InsightResponse.model_construct(
         title=insight.title,
-        description=insight.description,
-        component=insight.component,
-        severity=insight.severity.value,
+        description=description,
+        component=component,
+        severity=insight.severity.name,
         timestamp=insight.timestamp.isoformat(),
-        recommendations=insight.recommendations,
-        metrics=insight.metrics,
-        root_cause=insight.root_cause or "See analysis for details",
-        observation=insight.description,
+        recommendations=recommendations,
+        metrics=metrics,
+        root_cause=root_cause or "See analysis for details",
+        observation=description,
         immediate_action=(
-            insight.recommendations[0] if insight.recommendations
-            else "Review and investigate"
+            recommendations[0] if recommendations else "Review and investigate"
         ),
         confidence=95.0,
-        methodology=insight.root_cause or "use_method",
-        evidence={metric: "See report" for metric in insight.metrics},
+        methodology=root_cause or "use_method",
+        evidence=dict.fromkeys(metrics, "See report"),
+        icon=COMPONENT_EMOJI.get(component, ""),
     )
 
 
-def get_repository() -> InsightsRepository:
+async def get_repository() -> InsightsRepository:
     """
     Dependency injection for repository.
 
     Uses the repository instance injected by brendan_api_server during setup.
+    Once configure_repository() has run, FastAPI resolves this dependency to
+    the override instead, so this check only runs for unconfigured apps.
 
     Returns:
         Insights repository instance
@@ -83,12 +117,34 @@ def get_repository() -> InsightsRepository:
     return _repository_instance
 
 
+def configure_repository(app: FastAPI, repository: InsightsRepository) -> None:
+    """
+    Bind the repository used by the insights routes of an app.
+
+    Registers a dependency override returning the instance directly, so
+    requests skip the availability check. The override is a coroutine, so
+    FastAPI resolves it inline rather than through its thread pool.
+
+    Args:
+        app: Application the router is (or will be) included in
+        repository: Repository instance to serve insights from
+    """
+    global _repository_instance
+    _repository_instance = repository
+
+    async def configured_repository() -> InsightsRepository:
+        return repository
+
+    app.dependency_overrides[get_repository] = configured_repository
+
+
 @router.get("", response_model=InsightsListResponse)
 async def get_all_insights(
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of insights"),
     severity: Optional[str] = Query(None, description="Filter by severity (CRITICAL, HIGH, MEDIUM, LOW)"),
     component: Optional[str] = Query(None, description="Filter by component (cpu, memory, disk, network)"),
     repository: InsightsRepository = Depends(get_repository),
+    now_iso: str = Depends(_now_iso),
 ):
     """
     Get all insights with optional filtering.
@@ -115,7 +171,7 @@ async def get_all_insights(
         return InsightsListResponse(
             total=len(insights),
             insights=[_insight_to_response(i) for i in insights],
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -126,6 +182,7 @@ async def get_all_insights(
 @router.get("/latest", response_model=LatestInsightResponse)
 async def get_latest_insight(
     repository: InsightsRepository = Depends(get_repository),
+    now_iso: str = Depends(_now_iso),
 ):
     """
     Get the most recent insight.
@@ -145,13 +202,13 @@ async def get_latest_insight(
             return LatestInsightResponse(
                 insight=None,
                 message="No insights available",
-                timestamp=datetime.now().isoformat(),
+                timestamp=now_iso,
             )
 
         return LatestInsightResponse(
             insight=_insight_to_response(insight),
             message=None,
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading latest insight: {str(e)}")
@@ -161,6 +218,7 @@ async def get_latest_insight(
 async def get_insights_by_severity(
     severity: str,
     repository: InsightsRepository = Depends(get_repository),
+    now_iso: str = Depends(_now_iso),
 ):
     """
     Get insights filtered by severity level.
@@ -184,7 +242,7 @@ async def get_insights_by_severity(
             severity=severity.upper(),
             count=len(insights),
             insights=[_insight_to_response(i) for i in insights],
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -196,6 +254,7 @@ async def get_insights_by_severity(
 async def get_insights_by_component(
     component: str,
     repository: InsightsRepository = Depends(get_repository),
+    now_iso: str = Depends(_now_iso),
 ):
     """
     Get insights filtered by component.
@@ -219,7 +278,7 @@ async def get_insights_by_component(
             component=component.lower(),
             count=len(insights),
             insights=[_insight_to_response(i) for i in insights],
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading insights: {str(e)}")
@@ -228,6 +287,7 @@ async def get_insights_by_component(
 @router.get("/summary", response_model=InsightSummaryResponse)
 async def get_insights_summary(
     repository: InsightsRepository = Depends(get_repository),
+    now_iso: str = Depends(_now_iso),
 ):
     """
     Get summary statistics of current insights.
@@ -266,7 +326,7 @@ async def get_insights_summary(
             total_insights=summary["total_insights"],
             by_severity=summary["by_severity"],
             by_component=summary["by_component"],
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating summary: {str(e)}")
@@ -275,6 +335,7 @@ async def get_insights_summary(
 @router.get("/critical", response_model=InsightsListResponse)
 async def get_critical_insights(
     repository: InsightsRepository = Depends(get_repository),
+    now_iso: str = Depends(_now_iso),
 ):
     """
     Get only critical severity insights.
@@ -294,7 +355,7 @@ async def get_critical_insights(
         return InsightsListResponse(
             total=len(insights),
             insights=[_insight_to_response(i) for i in insights],
-            timestamp=datetime.now().isoformat(),
+            timestamp=now_iso,
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading critical insights: {str(e)}")
@@ -1,6 +1,7 @@
 """API schemas for request/response validation."""
 
 from .insight_schemas import (
+    COMPONENT_EMOJI,
     InsightResponse,
     InsightsListResponse,
     InsightSummaryResponse,
@@ -10,6 +11,7 @@ from .insight_schemas import (
 )
 
 __all__ = [
+    "COMPONENT_EMOJI",
     "InsightResponse",
     "InsightsListResponse",
     "InsightSummaryResponse",
@@ -5,6 +5,16 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
+# Display glyphs per component. Insight titles stay plain ASCII in the
+# domain; UIs that want an icon read it from the "icon" field instead.
+COMPONENT_EMOJI = {
+    "system": "🤖",
+    "cpu": "🔥",
+    "memory": "🧠",
+    "disk": "💾",
+    "network": "🌐",
+}
+
 
 class InsightResponse(BaseModel):
     """Response schema for a single insight."""
@@ -22,6 +32,7 @@ class InsightResponse(BaseModel):
     confidence: float = Field(default=95.0, description="Confidence level (0-100)")
     methodology: str = Field(..., description="Analysis methodology")
     evidence: dict = Field(default_factory=dict, description="Supporting evidence")
+    icon: str = Field(default="", description="Display glyph for the component")
 
     class Config:
         """Pydantic config."""
@@ -41,6 +52,7 @@ class InsightResponse(BaseModel):
                 "confidence": 95.0,
                 "methodology": "use_method",
                 "evidence": {"load_average": "5.2", "cpu_count": "4"},
+                "icon": "🔥",
             }
         }
 
@@ -0,0 +1,149 @@
+"""
+Tests for the AnalyzeSystem background monitoring loop
+
+Testes unitários para o produtor/consumidor de run_forever, com coletor falso.
+"""
+
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project root and src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.application.use_cases.performance.analyze_system import AnalyzeSystem
+from src.domain.performance.entities.system_metrics import SystemMetrics
+from src.domain.performance.services.bottleneck_detector import BottleneckDetector
+from src.domain.performance.services.use_method_analyzer import USEMethodAnalyzer
+from src.domain.performance.value_objects.metric_value import MetricValue
+
+
+def make_metrics(cpu: float) -> SystemMetrics:
+    """Cria métricas de teste com a CPU informada."""
+    return SystemMetrics(
+        timestamp=datetime.now(),
+        hostname="test-host",
+        cpu_utilization=MetricValue(cpu, "%"),
+        memory_utilization=MetricValue(10.0, "%"),
+    )
+
+
+class FakeCollector:
+    """Coletor que devolve as amostras em sequência (repete a última)."""
+
+    def __init__(self, samples):
+        self.samples = list(samples)
+        self.calls = 0
+
+    async def collect(self) -> SystemMetrics:
+        sample = self.samples[min(self.calls, len(self.samples) - 1)]
+        self.calls += 1
+        return sample
+
+
+class RecordingAnalyzer:
+    """CombinedAnalyzer falso que registra as amostras analisadas."""
+
+    def __init__(self, fail_on=()):
+        self.analyzed = []
+        self.fail_on = set(fail_on)
+
+    def analyze(self, metrics):
+        cpu = metrics.cpu_utilization.value
+        if cpu in self.fail_on:
+            raise RuntimeError(f"analysis failed for cpu={cpu}")
+        self.analyzed.append(cpu)
+        return [cpu]
+
+
+def make_system(samples, analyzer=None) -> AnalyzeSystem:
+    """Cria o caso de uso com coletor e analisador falsos."""
+    system = AnalyzeSystem(
+        FakeCollector(samples), USEMethodAnalyzer(), BottleneckDetector()
+    )
+    system.combined_analyzer = analyzer or RecordingAnalyzer()
+    return system
+
+
+async def run_consumer(system, snapshots):
+    """Entrega cada amostra ao consumidor e espera ela ser processada."""
+    queue = asyncio.Queue(maxsize=1)
+    consumer = asyncio.create_task(system._consume_metrics(queue))
+    for metrics in snapshots:
+        await queue.put(metrics)
+        while not queue.empty():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+    consumer.cancel()
+    await asyncio.gather(consumer, return_exceptions=True)
+
+
+class TestConsumer:
+    """Testes para _consume_metrics."""
+
+    def test_unchanged_bucket_is_skipped(self):
+        """Amostra no mesmo bucket quantizado não é reanalisada."""
+        system = make_system([])
+        snapshots = [make_metrics(cpu) for cpu in (10.0, 11.0, 14.9, 30.0)]
+
+        asyncio.run(run_consumer(system, snapshots))
+
+        assert system.combined_analyzer.analyzed == [10.0, 30.0]
+        assert system.latest_insights == [30.0]
+
+    def test_analysis_error_keeps_loop_running(self):
+        """Falha numa amostra é registrada e a próxima ainda é analisada."""
+        system = make_system([], RecordingAnalyzer(fail_on={50.0}))
+        snapshots = [make_metrics(cpu) for cpu in (10.0, 50.0, 80.0)]
+
+        asyncio.run(run_consumer(system, snapshots))
+
+        assert system.combined_analyzer.analyzed == [10.0, 80.0]
+        assert system.latest_insights == [80.0]
+
+
+class TestProducer:
+    """Testes para _produce_metrics."""
+
+    def test_stale_snapshot_is_replaced(self):
+        """Fila de uma posição guarda só a amostra mais recente."""
+        samples = [make_metrics(cpu) for cpu in (10.0, 20.0, 30.0, 40.0)]
+        system = make_system(samples)
+
+        async def produce():
+            queue = asyncio.Queue(maxsize=1)
+            producer = asyncio.create_task(system._produce_metrics(queue, 0))
+            while system.metrics_collector.calls < len(samples):
+                await asyncio.sleep(0)
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            return queue
+
+        queue = asyncio.run(produce())
+
+        assert queue.qsize() == 1
+        assert queue.get_nowait() is samples[-1]
+        # The ring buffer still keeps every sample
+        assert list(system.metrics_history)[: len(samples)] == samples
+
+
+class TestRunForever:
+    """Testes para run_forever."""
+
+    def test_cancellation_stops_producer(self):
+        """Cancelar run_forever encerra também a tarefa produtora."""
+        system = make_system([make_metrics(cpu) for cpu in (10.0, 30.0)])
+
+        async def run_and_cancel():
+            task = asyncio.create_task(system.run_forever(interval_seconds=0.01))
+            while len(system.combined_analyzer.analyzed) < 2:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            assert task.cancelled()
+            return asyncio.all_tasks() - {asyncio.current_task()}
+
+        assert asyncio.run(run_and_cancel()) == set()
+        assert system.combined_analyzer.analyzed == [10.0, 30.0]
@@ -0,0 +1,72 @@
+"""
+Tests for the LLM JSON helpers
+
+Testes unitários para a extração de JSON de respostas (parciais) do LLM.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root and src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.infrastructure.ai._json import extract_top_level_json, loads
+
+
+class TestExtractTopLevelJson:
+    """Testes para extract_top_level_json."""
+
+    def test_object_surrounded_by_prose(self):
+        """Extrai o objeto e ignora texto antes e depois."""
+        text = 'Here you go: {"a": 1, "b": [1, 2]} hope it helps }'
+        assert extract_top_level_json(text) == '{"a": 1, "b": [1, 2]}'
+
+    def test_partial_buffer_returns_none(self):
+        """Buffer cortado no meio do objeto ainda não tem JSON completo."""
+        assert extract_top_level_json('{"insights": [{"title": "CPU"') is None
+
+    def test_unterminated_string_returns_none(self):
+        """Chave de fechamento dentro de string aberta não fecha o objeto."""
+        assert extract_top_level_json('{"a": "x}') is None
+        assert extract_top_level_json('{"a": "x}]"') is None
+
+    def test_brackets_inside_string_values(self):
+        """Colchetes e chaves dentro de strings não alteram a profundidade."""
+        text = '{"a": "}{][", "b": "[x]"} trailing'
+        result = extract_top_level_json(text)
+        assert result == '{"a": "}{][", "b": "[x]"}'
+        assert loads(result) == {"a": "}{][", "b": "[x]"}
+
+    def test_escaped_quotes(self):
+        """Aspas escapadas não encerram a string."""
+        text = r'{"a": "say \"}\" now"} tail'
+        result = extract_top_level_json(text)
+        assert result == r'{"a": "say \"}\" now"}'
+        assert loads(result) == {"a": 'say "}" now'}
+
+    def test_escaped_backslash_before_quote(self):
+        """Barra invertida escapada não escapa a aspa seguinte."""
+        text = r'{"a": "dir\\"} tail'
+        result = extract_top_level_json(text)
+        assert result == r'{"a": "dir\\"}'
+        assert loads(result) == {"a": "dir\\"}
+
+    def test_partial_buffer_after_escaped_quote(self):
+        """String ainda aberta após uma aspa escapada."""
+        assert extract_top_level_json(r'{"a": "x\"}') is None
+
+    def test_array_opener(self):
+        """Com opener "[" extrai o primeiro array."""
+        text = 'prefix {"x": 1} [{"t": 1}, {"t": 2}]'
+        assert extract_top_level_json(text, "[") == '[{"t": 1}, {"t": 2}]'
+
+    def test_any_opener_picks_first(self):
+        """Com opener None começa no primeiro "{" ou "[" do texto."""
+        assert extract_top_level_json('[{"t":1},{"t":2}]', None) == '[{"t":1},{"t":2}]'
+        assert extract_top_level_json('x {"a": [1]} [2]', None) == '{"a": [1]}'
+
+    def test_no_json(self):
+        """Texto sem JSON retorna None."""
+        assert extract_top_level_json("no json here") is None
+        assert extract_top_level_json("no json here", None) is None
@@ -0,0 +1,161 @@
+"""
+Tests for OllamaLLMClient
+
+Testes unitários para o cliente Ollama, sem chamadas HTTP reais.
+"""
+
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add project root and src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from src.domain.ai_agent.value_objects.llm_config import DEFAULT_LLM_THRESHOLDS
+from src.domain.performance.entities.system_metrics import SystemMetrics
+from src.domain.performance.value_objects.metric_value import MetricValue
+from src.infrastructure.ai import ollama_llm_client
+from src.infrastructure.ai.ollama_llm_client import OllamaLLMClient
+
+LLM_RESPONSE = (
+    '{"insights": [{"title": "CPU Saturation", "description": "d", '
+    '"component": "cpu", "severity": "HIGH"}]}'
+)
+
+
+def make_metrics(cpu=0.0, memory=0.0, disk=0.0, network_errors=0):
+    """Cria métricas de teste (todas abaixo dos limites por padrão)."""
+    return SystemMetrics(
+        timestamp=datetime.now(),
+        hostname="test-host",
+        cpu_utilization=MetricValue(cpu, "%"),
+        memory_utilization=MetricValue(memory, "%"),
+        disk_utilization={"sda1": MetricValue(disk, "%")},
+        network_errors=MetricValue(network_errors, "count"),
+    )
+
+
+@pytest.fixture
+def http_calls(monkeypatch):
+    """Substitui a chamada HTTP ao Ollama e registra os prompts enviados."""
+    calls = []
+
+    async def fake_generate(url, envelope, prompt, timeout, stop_at_json=False):
+        calls.append(prompt)
+        return LLM_RESPONSE
+
+    monkeypatch.setattr(ollama_llm_client, "ollama_generate", fake_generate)
+    return calls
+
+
+@pytest.fixture
+def client():
+    """Cliente com os limites padrão."""
+    return OllamaLLMClient(base_url="http://ollama.test", model="test-model")
+
+
+class TestNeedsLLM:
+    """Testes para os limites que decidem se o LLM é chamado."""
+
+    @pytest.mark.parametrize(
+        "metrics, expected",
+        [
+            (make_metrics(cpu=49.9), False),
+            (make_metrics(cpu=50.0), True),
+            (make_metrics(memory=59.9), False),
+            (make_metrics(memory=60.0), True),
+            (make_metrics(disk=59.9), False),
+            (make_metrics(disk=60.0), True),
+            (make_metrics(network_errors=0), False),
+            (make_metrics(network_errors=1), True),
+        ],
+    )
+    def test_threshold_boundaries(self, client, metrics, expected):
+        """Limites exatos: >= para utilização, > 0 para erros de rede."""
+        assert client._needs_llm(metrics) is expected
+
+    def test_thresholds_override_merges_with_defaults(self):
+        """Override parcial mantém os demais limites padrão."""
+        client = OllamaLLMClient(
+            base_url="http://ollama.test",
+            model="test-model",
+            thresholds={"cpu_utilization": 80.0},
+        )
+
+        assert client.thresholds == {
+            **DEFAULT_LLM_THRESHOLDS,
+            "cpu_utilization": 80.0,
+        }
+        assert not client._needs_llm(make_metrics(cpu=79.9))
+        assert client._needs_llm(make_metrics(cpu=80.0))
+        assert client._needs_llm(make_metrics(memory=60.0))
+
+
+class TestGenerateInsights:
+    """Testes para generate_insights."""
+
+    def test_healthy_system_skips_http(self, client, http_calls):
+        """Sem métricas acima dos limites, nenhuma chamada HTTP é feita."""
+        insights = asyncio.run(client.generate_insights(make_metrics()))
+
+        assert insights == []
+        assert http_calls == []
+
+    def test_threshold_crossed_calls_llm(self, client, http_calls):
+        """Métrica acima do limite dispara uma chamada ao LLM."""
+        insights = asyncio.run(client.generate_insights(make_metrics(cpu=50.0)))
+
+        assert len(http_calls) == 1
+        assert [i.title for i in insights] == ["CPU Saturation"]
+
+    def test_without_metrics_calls_llm(self, client, http_calls):
+        """Sem métricas, a análise genérica sempre chama o LLM."""
+        asyncio.run(client.generate_insights(None))
+        assert len(http_calls) == 1
+
+
+class TestGenerateInsightsBatch:
+    """Testes para generate_insights_batch."""
+
+    def test_duplicate_prompts_share_one_call(self, client, http_calls):
+        """Snapshots com o mesmo prompt geram uma única chamada HTTP."""
+        results = asyncio.run(
+            client.generate_insights_batch(
+                [make_metrics(cpu=70.0), make_metrics(cpu=90.0)]
+            )
+        )
+
+        assert len(http_calls) == 1
+        assert [[i.title for i in r] for r in results] == [
+            ["CPU Saturation"],
+            ["CPU Saturation"],
+        ]
+
+    def test_results_follow_input_order(self, client, monkeypatch):
+        """Resultados voltam na ordem de entrada, com [] abaixo dos limites."""
+        calls = []
+
+        async def fake_generate(url, envelope, prompt, timeout, stop_at_json=False):
+            calls.append(prompt)
+            title = "Generic" if "general system" in prompt else "Live"
+            return LLM_RESPONSE.replace("CPU Saturation", title)
+
+        monkeypatch.setattr(ollama_llm_client, "ollama_generate", fake_generate)
+
+        results = asyncio.run(
+            client.generate_insights_batch(
+                [None, make_metrics(cpu=70.0), make_metrics(), make_metrics(cpu=90.0)]
+            )
+        )
+
+        assert len(calls) == 2
+        assert [[i.title for i in r] for r in results] == [
+            ["Generic"],
+            ["Live"],
+            [],
+            ["Live"],
+        ]
@@ -0,0 +1,185 @@
+"""
+Tests for the performance domain
+
+Testes unitários para value objects e serviços de domínio de performance.
+"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from domain.performance.aggregates.analysis_session import AnalysisSession
+from domain.performance.entities.performance_insight import PerformanceInsight
+from domain.performance.entities.system_metrics import (
+    CRITICAL_THRESHOLDS,
+    SystemMetrics,
+)
+from domain.performance.services.bottleneck_detector import BottleneckDetector
+from domain.performance.value_objects.metric_value import MetricValue
+from domain.performance.value_objects.severity import Severity
+from domain.performance.value_objects.threshold import Threshold
+
+
+def make_metrics(cpu: float, memory: float) -> SystemMetrics:
+    """Cria métricas de teste com CPU e memória informadas."""
+    return SystemMetrics(
+        timestamp=datetime.now(),
+        hostname="test-host",
+        cpu_utilization=MetricValue(cpu, "%"),
+        memory_utilization=MetricValue(memory, "%"),
+    )
+
+
+class TestThreshold:
+    """Testes para Threshold.get_severity."""
+
+    def setup_method(self):
+        """Setup para cada teste."""
+        self.threshold = Threshold(warning=70, critical=90)
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (0, None),
+            (69.9, None),
+            (70, Severity.HIGH),
+            (70.1, Severity.HIGH),
+            (89.9, Severity.HIGH),
+            (90, Severity.CRITICAL),
+            (90.1, Severity.CRITICAL),
+            (100, Severity.CRITICAL),
+        ],
+    )
+    def test_boundaries(self, value, expected):
+        """Limites exatos de warning e critical usam >=."""
+        assert self.threshold.get_severity(value) == expected
+
+    def test_only_warning(self):
+        """Sem critical, nunca retorna Severity.CRITICAL."""
+        threshold = Threshold(warning=80)
+        assert threshold.get_severity(79.9) is None
+        assert threshold.get_severity(80) is Severity.HIGH
+        assert threshold.get_severity(1000) is Severity.HIGH
+
+    def test_no_bounds(self):
+        """Sem limites, nenhum valor tem severidade."""
+        assert Threshold().get_severity(100) is None
+
+    def test_critical_checked_before_warning(self):
+        """Com warning acima de critical, critical continua tendo prioridade."""
+        threshold = Threshold(warning=90, critical=80)
+        assert threshold.get_severity(79.9) is None
+        assert threshold.get_severity(80) is Severity.CRITICAL
+        assert threshold.get_severity(95) is Severity.CRITICAL
+
+    def test_zero_bound_is_disabled(self):
+        """Limite zero é tratado como ausente."""
+        threshold = Threshold(warning=0, critical=90)
+        assert threshold.get_severity(10) is None
+        assert threshold.get_severity(90) is Severity.CRITICAL
+
+
+# Bottlenecks exigem utilização estritamente acima de 85% (HIGH) e 95% (CRITICAL)
+UTILIZATION_CASES = [
+    (50.0, None),
+    (85.0, None),
+    (85.01, Severity.HIGH),
+    (90.0, Severity.HIGH),
+    (95.0, Severity.HIGH),
+    (95.01, Severity.CRITICAL),
+    (100.0, Severity.CRITICAL),
+]
+
+
+class TestBottleneckDetector:
+    """Testes para BottleneckDetector."""
+
+    def setup_method(self):
+        """Setup para cada teste."""
+        self.detector = BottleneckDetector()
+
+    @pytest.mark.parametrize("value, expected", UTILIZATION_CASES)
+    def test_cpu_boundaries(self, value, expected):
+        """Limites exatos de CPU no caminho escalar."""
+        insight = self.detector.detect_cpu_bottleneck(make_metrics(value, 0.0))
+        assert (insight.severity if insight else None) == expected
+
+    @pytest.mark.parametrize("value, expected", UTILIZATION_CASES)
+    def test_memory_boundaries(self, value, expected):
+        """Limites exatos de memória no caminho escalar."""
+        insight = self.detector.detect_memory_bottleneck(make_metrics(0.0, value))
+        assert (insight.severity if insight else None) == expected
+
+    def test_batch_boundaries(self):
+        """Caminho vetorizado classifica os limites como o escalar."""
+        values = [value for value, _ in UTILIZATION_CASES]
+        batch = self.detector.detect_batch(
+            [make_metrics(cpu, memory) for cpu, memory in zip(values, values[::-1])]
+        )
+
+        for cpu, memory, insights in zip(values, values[::-1], batch):
+            expected = self.detector.detect_bottlenecks(make_metrics(cpu, memory))
+            assert [(i.component, i.severity, i.description) for i in insights] == [
+                (i.component, i.severity, i.description) for i in expected
+            ]
+
+        cpu_severities = [
+            next((i.severity for i in insights if i.component == "cpu"), None)
+            for insights in batch
+        ]
+        assert cpu_severities == [expected for _, expected in UTILIZATION_CASES]
+
+    def test_batch_empty(self):
+        """Lote vazio retorna lista vazia."""
+        assert self.detector.detect_batch([]) == []
+
+
+class TestAnalysisSession:
+    """Testes para AnalysisSession."""
+
+    def setup_method(self):
+        """Setup para cada teste."""
+        self.session = AnalysisSession(session_id="s1", hostname="test-host")
+
+    def test_no_metrics_is_not_critical(self):
+        """Sessão sem amostras não tem métricas críticas."""
+        assert not self.session.has_critical_metrics()
+
+    @pytest.mark.parametrize(
+        "cpu, memory, expected",
+        [
+            (CRITICAL_THRESHOLDS["cpu_utilization"] - 0.1, 0.0, False),
+            (CRITICAL_THRESHOLDS["cpu_utilization"], 0.0, True),
+            (0.0, CRITICAL_THRESHOLDS["memory_utilization"] - 0.1, False),
+            (0.0, CRITICAL_THRESHOLDS["memory_utilization"], True),
+        ],
+    )
+    def test_critical_threshold_boundaries(self, cpu, memory, expected):
+        """Amostra exatamente no limite crítico conta como crítica."""
+        self.session.add_metrics(make_metrics(10.0, 10.0))
+        self.session.add_metrics(make_metrics(cpu, memory))
+        assert self.session.has_critical_metrics() is expected
+
+    def test_insight_indexes(self):
+        """Consultas por componente e severidade usam os índices."""
+        cpu = PerformanceInsight("CPU", "d", "cpu", Severity.CRITICAL)
+        disk = PerformanceInsight("Disk", "d", "disk", Severity.LOW)
+        self.session.add_insight(cpu)
+        self.session.add_insight(disk)
+
+        assert self.session.get_insights_by_component("cpu") == [cpu]
+        assert self.session.get_insights_by_component("network") == []
+        assert self.session.get_critical_insights() == [cpu]
+        assert self.session.get_insights_by_severity(Severity.LOW) == [disk]
+        assert self.session.has_critical_issues()
+
+    def test_insights_passed_at_creation_are_indexed(self):
+        """Insights passados no construtor também entram nos índices."""
+        cpu = PerformanceInsight("CPU", "d", "cpu", Severity.CRITICAL)
+        session = AnalysisSession(session_id="s2", hostname="h", insights=[cpu])
+        assert session.get_critical_insights() == [cpu]
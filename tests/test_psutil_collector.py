@@ -0,0 +1,169 @@
+"""
+Tests for PsutilCollector
+
+Testes unitários para o coletor psutil, com psutil e /proc/stat substituídos.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add project root and src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from infrastructure.monitoring import psutil_collector
+from infrastructure.monitoring.psutil_collector import (
+    MIN_CPU_SAMPLE_INTERVAL,
+    PsutilCollector,
+)
+
+
+class FakePsutil:
+    """Estado controlado pelos testes no lugar de psutil e /proc/stat."""
+
+    def __init__(self):
+        self.cpu_ticks = (100, 1000)
+        self.memory_calls = 0
+        self.disk_usage_calls = []
+        self.partitions = [("/dev/sda1", "/")]
+        self.slow_mounts = {}
+
+    def read_cpu_stat(self):
+        return self.cpu_ticks, 42
+
+    def virtual_memory(self):
+        self.memory_calls += 1
+        return SimpleNamespace(
+            percent=25.0, available=6 * 1024**3, total=8 * 1024**3, used=2 * 1024**3
+        )
+
+    def disk_partitions(self, all=False):
+        return [
+            SimpleNamespace(device=device, mountpoint=mountpoint, fstype="ext4")
+            for device, mountpoint in self.partitions
+        ]
+
+    def disk_usage(self, mountpoint):
+        self.disk_usage_calls.append(mountpoint)
+        release = self.slow_mounts.get(mountpoint)
+        if release is not None:
+            release.wait()
+        return SimpleNamespace(used=40, total=100)
+
+
+@pytest.fixture
+def fake_psutil(monkeypatch):
+    """Substitui as chamadas a psutil e a leitura de /proc/stat."""
+    fake = FakePsutil()
+    psutil = psutil_collector.psutil
+    monkeypatch.setattr(psutil_collector, "_read_cpu_stat", fake.read_cpu_stat)
+    monkeypatch.setattr(psutil, "cpu_count", lambda logical=True: 4)
+    monkeypatch.setattr(psutil, "getloadavg", lambda: (1.0, 0.5, 0.25))
+    monkeypatch.setattr(psutil, "virtual_memory", fake.virtual_memory)
+    monkeypatch.setattr(
+        psutil, "swap_memory", lambda: SimpleNamespace(percent=0.0, total=0)
+    )
+    monkeypatch.setattr(psutil, "disk_partitions", fake.disk_partitions)
+    monkeypatch.setattr(psutil, "disk_usage", fake.disk_usage)
+    monkeypatch.setattr(psutil, "disk_io_counters", lambda: None)
+    monkeypatch.setattr(psutil, "net_io_counters", lambda pernic=True: {})
+    yield fake
+    # Let any hung disk_usage call finish so the pool threads exit
+    for release in fake.slow_mounts.values():
+        release.set()
+
+
+@pytest.fixture
+def collector(fake_psutil):
+    """Coletor com TTL longo, fechado ao final do teste."""
+    collector = PsutilCollector(cache_duration=60.0, disk_timeout=0.05)
+    yield collector
+    collector.close()
+
+
+class TestCollect:
+    """Testes para collect."""
+
+    def test_ttl_reuses_snapshot(self, collector, fake_psutil):
+        """Dentro do TTL, collect devolve o mesmo objeto sem reler o psutil."""
+        first = asyncio.run(collector.collect())
+        second = asyncio.run(collector.collect())
+
+        assert second is first
+        assert fake_psutil.memory_calls == 1
+
+    def test_background_returns_latest(self, fake_psutil):
+        """Com o amostrador em segundo plano, collect lê apenas _latest."""
+        collector = PsutilCollector(cache_duration=60.0, background=True)
+        try:
+            calls = fake_psutil.memory_calls
+            metrics = asyncio.run(collector.collect())
+
+            assert metrics is collector._latest
+            assert fake_psutil.memory_calls == calls
+        finally:
+            collector.close()
+
+    def test_collect_after_close_raises(self, collector):
+        """Depois de close, collect falha com erro claro."""
+        asyncio.run(collector.collect())
+        collector.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            asyncio.run(collector.collect())
+
+
+class TestCpuMetrics:
+    """Testes para _collect_cpu_metrics."""
+
+    def test_utilization_from_tick_delta(self, collector, fake_psutil):
+        """Utilização é a fração ocupada do tempo de CPU entre duas leituras."""
+        collector._cpu_primed_at = time.monotonic() - MIN_CPU_SAMPLE_INTERVAL
+        fake_psutil.cpu_ticks = (150, 1100)
+
+        cpu = collector._collect_cpu_metrics()
+
+        assert cpu["utilization"] == 50.0
+        assert cpu["context_switches"] == 42
+        assert cpu["saturation"] == 25.0
+
+    def test_first_call_right_after_startup_uses_boot_average(
+        self, collector, fake_psutil
+    ):
+        """Logo após a inicialização, usa a média desde o boot."""
+        fake_psutil.cpu_ticks = (150, 1100)
+
+        cpu = collector._collect_cpu_metrics()
+
+        assert cpu["utilization"] == round(150 / 1100 * 100, 1)
+
+
+class TestDiskMetrics:
+    """Testes para _collect_disk_metrics."""
+
+    def test_timed_out_mount_is_skipped_next_cycle(self, collector, fake_psutil):
+        """Partição com timeout só é consultada de novo quando a chamada termina."""
+        release = threading.Event()
+        fake_psutil.partitions.append(("nfs:/share", "/mnt/nfs"))
+        fake_psutil.slow_mounts["/mnt/nfs"] = release
+
+        first = collector._collect_disk_metrics()
+        assert list(first["utilization"]) == ["/dev/sda1"]
+        assert "/mnt/nfs" in collector._disk_inflight
+
+        second = collector._collect_disk_metrics()
+        assert list(second["utilization"]) == ["/dev/sda1"]
+        assert fake_psutil.disk_usage_calls.count("/mnt/nfs") == 1
+
+        # Once the hung call returns the mount is queried again
+        release.set()
+        collector._disk_inflight["/mnt/nfs"].result(timeout=1)
+        third = collector._collect_disk_metrics()
+        assert set(third["utilization"]) == {"/dev/sda1", "nfs:/share"}
+        assert fake_psutil.disk_usage_calls.count("/mnt/nfs") == 2